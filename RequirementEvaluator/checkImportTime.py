@@ -0,0 +1,68 @@
+# Checks the import budget of the console path of the requirements evaluator with python -X importtime. The console
+# modes must not import the gui, plotting or server dependencies and their imports have to stay within the budget.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules that are only loaded by the gui and server modes
+forbiddenModules = ["tkinter", "matplotlib", "asyncio"]
+
+
+def parseArguments():
+    ''' Parses the arguments and returns the args object. '''
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--budget',
+                        type=float,
+                        dest="budget",
+                        default=750,
+                        help='budget of the median import time in milliseconds. Default: 750')
+    parser.add_argument('--runs',
+                        type=int,
+                        dest="runs",
+                        default=5,
+                        help='number of measured starts after one start that warms the caches. Default: 5')
+    return parser.parse_args()
+
+
+def measureImports():
+    ''' Starts the console path once. Returns the cumulative import time (microseconds) of each top level module and
+    the names of all imported modules. '''
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "RequirementsEvaluator.py")
+    result = subprocess.run([sys.executable, "-X", "importtime", script, "--help"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    imports = {}
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.add(name.strip())
+        # Nested imports are indented and already contained in the cumulative time of their parent
+        if not name[1:].startswith(" "):
+            imports[name.strip()] = int(cumulative)
+    return imports, modules
+
+
+if __name__ == "__main__":
+    args = parseArguments()
+
+    measureImports()
+    runs = [measureImports() for _ in range(args.runs)]
+    median = statistics.median(sum(imports.values()) / 1000 for imports, _ in runs)
+
+    print("Import time of the console path: " + format(median, ".0f") + " ms (median of " + str(args.runs) +
+          " runs, budget " + format(args.budget, ".0f") + " ms)")
+    imports, modules = runs[-1]
+    for name, cumulative in sorted(imports.items(), key=lambda entry: entry[1], reverse=True)[:5]:
+        print("  " + name + ": " + format(cumulative / 1000, ".0f") + " ms")
+
+    forbidden = [module for module in forbiddenModules
+                 if any(name.split(".")[0] == module for name in modules)]
+    if forbidden:
+        print("The console path imports " + ", ".join(forbidden))
+        exit(1)
+    if median > args.budget:
+        print("The console path exceeds the import budget")
+        exit(1)
@@ -0,0 +1,91 @@
+# Checks the analytic sensitivity analysis of the requirements evaluator by rescoring. Every crossover weight has to
+# change the order of its pair and every top algorithm has to stay on top within its stable interval and lose the top
+# just outside of it, a missing score is never on top. Accepts the arguments of the evaluator, e.g.
+# python checkSensitivity.py --in Test_Car-All.csv --memory 1
+import numpy as np
+
+from RequirementsEvaluator import parseArguments
+from evaluator import SamplingFrame, getMetrics, getPrioritization
+
+# Distance of the rescored weights to a bound, relative to bounds above 1
+tolerance = 1e-6
+
+
+def getDistance(bound):
+    ''' Returns the distance of the rescored weights to the given bound. '''
+    return tolerance * max(1, abs(bound))
+
+
+def rescore(samplingFrame, weights, points):
+    ''' Rescores the averages with the weight of one metric replaced per point. points are pairs of the metric index
+    and its weight, returns the scores and ranks as P x A matrices. '''
+    matrix = np.repeat(np.asarray(weights, dtype=float)[np.newaxis], len(points), axis=0)
+    for row, (metric, weight) in enumerate(points):
+        matrix[row, metric] = weight
+    return samplingFrame.scoreAverages(matrix, samplingFrame.getAlgorithmAverages().values)
+
+
+if __name__ == "__main__":
+    args = parseArguments()
+    prioritization = getPrioritization(args)
+    samplingFrame = SamplingFrame(args.aggregate, args.penalty, getMetrics(args))
+    samplingFrame.load(args.input, args.jobs, args.cache)
+    if len(samplingFrame.getAlgorithmAverages()) == 0:
+        print("No data loaded!")
+        exit(1)
+    crossovers, stability = samplingFrame.calculate_Sensitivity(prioritization)
+    weights = prioritization.getWeights(samplingFrame.metrics)
+    algorithms = list(samplingFrame.getAlgorithmAverages().index)
+    failures = []
+
+    # The order of each pair differs just before (or at weight 0) and just after its crossover weight
+    metrics = [samplingFrame.criteria.index(metric) for metric in crossovers["Metric"]]
+    before = [(metric, max(weight - getDistance(weight), 0))
+              for metric, weight in zip(metrics, crossovers["Crossover Weight"])]
+    after = [(metric, weight + getDistance(weight))
+             for metric, weight in zip(metrics, crossovers["Crossover Weight"])]
+    scoresBefore = rescore(samplingFrame, weights, before)
+    scoresAfter = rescore(samplingFrame, weights, after)
+    for row, crossover in enumerate(crossovers.itertuples(index=False)):
+        first = algorithms.index(crossover[2])
+        second = algorithms.index(crossover[3])
+        ranks = [scoresBefore[crossover.Score + " Rank"][row], scoresAfter[crossover.Score + " Rank"][row]]
+        if np.sign(ranks[0][first] - ranks[0][second]) == np.sign(ranks[1][first] - ranks[1][second]):
+            failures.append("Crossover " + " ".join(str(value) for value in crossover) +
+                            " does not change the order of the pair")
+
+    # Each top algorithm is ranked first inside its interval and not just outside of it
+    checks = []
+    for row, entry in enumerate(stability.itertuples(index=False)):
+        metric = samplingFrame.criteria.index(entry.Metric)
+        lower = entry[4]
+        upper = entry[5]
+        if lower == upper:
+            checks.append((row, metric, lower, True))
+        else:
+            checks.append((row, metric, lower + min(getDistance(lower), (upper - lower) / 2), True))
+            if np.isfinite(upper):
+                checks.append((row, metric, upper - min(getDistance(upper), (upper - lower) / 2), True))
+            else:
+                checks.append((row, metric, max(lower, 1) / tolerance, True))
+        if lower > 0:
+            checks.append((row, metric, max(lower - getDistance(lower), 0), False))
+        if np.isfinite(upper):
+            checks.append((row, metric, upper + getDistance(upper), False))
+    scores = rescore(samplingFrame, weights, [(metric, weight) for _, metric, weight, _ in checks])
+    for point, (row, _, weight, inside) in enumerate(checks):
+        entry = stability.iloc[row]
+        algorithm = algorithms.index(entry["Algorithm"])
+        onTop = scores[entry["Score"] + " Rank"][point][algorithm] == 1 and \
+            not np.isnan(scores[entry["Score"]][point][algorithm])
+        if onTop != inside:
+            failures.append(entry["Score"] + " " + entry["Algorithm"] + " " + entry["Metric"] + " is " +
+                            ("not " if not onTop else "") + "on top at weight " + str(weight) + ", stable from " +
+                            str(entry["Stable From"]) + " to " + str(entry["Stable To"]))
+
+    print("Checked " + str(len(crossovers)) + " crossover weights and " + str(len(checks)) +
+          " weights around the stable intervals of " + str(prioritization))
+    for failure in failures:
+        print("  " + failure)
+    if failures:
+        exit(1)
@@ -0,0 +1,6 @@
+# Importable core of the requirements evaluator. The gui (evaluator.gui) and the server (evaluator.server) are
+# separate modules, so importing the core does not load tkinter, matplotlib or asyncio.
+from .core import (AverageAccumulator, Metric, Prioritization, SamplingCache, SamplingFrame, baseMetrics,
+                   calculateScoreMatrices, denseRank, getMetric, getMetrics, getPrioritization,
+                   getPrioritizationFromWeights, getPrioritizationLabels, getSearchWeights, getSweepRange,
+                   getSweepWeights, holmCorrection, mannWhitneyMatrices, metricRegistry, printScores, writeEvaluation)
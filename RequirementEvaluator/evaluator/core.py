@@ -0,0 +1,1926 @@
+# Scoring core of the requirements evaluator. It has no GUI or plotting dependencies, so it can be imported as a
+# library and keeps the start of the console modes fast.
+import hashlib
+import io
+import json
+import math
+import os
+import tempfile
+import warnings
+# For parallel loading
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Helper
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+def printScores(samplingFrame, prioritization):
+    ''' Prints the scores and averages of the given sampling frame. '''
+    penalty = "" if samplingFrame.penalty is None else ", PAR-" + \
+        format(samplingFrame.penalty, "g")
+    print("\nResults for "+str(prioritization)+" (aggregator: " +
+          samplingFrame.aggregate+penalty+"):")
+    pd.set_option('display.max_colwidth', None)
+    print(samplingFrame.average[[
+          "Algorithm", "NBS", "NBS Rank", "SRBS", "SRBS Rank", "WRBS", "WRBS Rank", "IWRBS", "IWRBS Rank"] + samplingFrame.criteriaAveraged])
+    print(samplingFrame.average[["Algorithm"] + samplingFrame.criteriaAveraged])
+
+
+def writeEvaluation(absoluteFilePath, view, prioritization, samplingFrame):
+    ''' Writes the tira evaluation of the algorithm in the given view (its row of the averages) as prototext. '''
+    measures = [("Prioritization", str(prioritization)),
+                ("Aggregation", samplingFrame.aggregate)]
+    if samplingFrame.penalty is not None:
+        measures.append(("Penalty", "PAR-" + format(samplingFrame.penalty, "g")))
+    # Scores, ranks and data averages
+    measures += [(key, str(view[column].iloc[0])) for key, column in [
+        ("NBS", "NBS"), ("NBS Rank", "NBS Rank"), ("SRBS", "SRBS"), ("SRBS Rank", "SRBS Rank"),
+        ("WRBS", "WRBS"), ("WRBS Rank", "WRBS Rank"), ("IWRBS ", "IWRBS"), ("IWRBS Rank", "IWRBS Rank"),
+        ("Avg. Sample Size", "Avg. Size"), ("Avg. Sample Time", "Avg. Time"),
+        ("Avg. Sample Coverage", "Avg. Coverage"), ("Avg. Sample Similarity", "Avg. Similarity"),
+        ("Avg. Sample Memory", "Avg. Memory")]]
+
+    with open(absoluteFilePath, 'w+') as file:
+        for key, value in measures:
+            file.write("measure {\n")
+            file.write("  key : " + "\"" + key + "\"\n")
+            file.write("  value : " + "\"" + value + "\"\n")
+            file.write("}\n")
+
+
+def getSweepTables(weights, inputs, algorithms, metrics, lowerIsBetter, optional):
+    ''' Scores the given P x M weights against the A x 2M score inputs (averages and NBS subscores) and returns the
+    long-format sweep table of each score with one row per prioritization and algorithm. '''
+    criteria = weights.shape[1]
+    scores = calculateScoreMatrices(
+        weights, inputs[:, :criteria], inputs[:, criteria:], lowerIsBetter, optional)
+
+    # Columns of a single score, one row per prioritization and algorithm
+    prioritizations = len(weights)
+    block = {"Prioritization": np.repeat(getPrioritizationLabels(weights, metrics), len(algorithms))}
+    for index, metric in enumerate(metrics):
+        block[metric.name] = np.repeat(weights[:, index], len(algorithms))
+    block["Algorithm"] = np.tile(algorithms, prioritizations)
+
+    tables = {}
+    for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+        table = pd.DataFrame(block)
+        table["Score"] = score
+        table["Value"] = scores[score].ravel()
+        table["Rank"] = scores[score + " Rank"].ravel()
+        tables[score] = table
+    return tables
+
+
+def scoreSweepChunk(absoluteInputsPath, weights, algorithms, metrics, lowerIsBetter, optional):
+    ''' Builds the sweep tables of a chunk of weights against the memory-mapped score inputs. Used by the processes of
+    the sweep executor. '''
+    inputs = np.load(absoluteInputsPath, mmap_mode="r")
+    return getSweepTables(weights, inputs, algorithms, metrics, lowerIsBetter, optional)
+
+
+def readSamplingFile(absoluteFilePath):
+    ''' Reads a single result file. Used by the processes of the parallel loader. '''
+    return SamplingFrame().readFile(absoluteFilePath)
+
+
+def readSubmissionAlgorithm(absoluteFilePath):
+    ''' Reads the algorithm of a single submission. Used by the processes of the tira batch. '''
+    return SamplingFrame().readAlgorithm(absoluteFilePath)
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# Prioritization
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class Metric:
+    ''' A criterion that can be weighted by a prioritization. normalization defines the NBS subscore: "column" uses
+    the average of the normalized column, "identity" the average itself and "best" the ratio of the average to the
+    best average. Values below missingBelow are sentinels for missing measurements, None keeps all values. '''
+    key = ""
+    name = ""
+    label = ""
+    column = ""
+    lowerIsBetter = False
+    normalization = "identity"
+    normalizedColumn = None
+    optional = False
+    missingBelow = 0
+
+    def __init__(self, key, name, label, column, lowerIsBetter, normalization="identity", normalizedColumn=None,
+                 optional=False, missingBelow=0):
+        self.key = key
+        self.name = name
+        self.label = label
+        self.column = column
+        self.lowerIsBetter = lowerIsBetter
+        self.normalization = normalization
+        self.normalizedColumn = normalizedColumn
+        self.optional = optional
+        self.missingBelow = missingBelow
+
+
+# All metrics that can be weighted, the first five are always scored. Optional metrics are skipped in the NBS if
+# their subscore is missing
+metricRegistry = [
+    Metric("size", "Size", "S", "Sample Size", True,
+           "column", "Nom. Sample Size"),
+    Metric("time", "Time", "T", "Sample Time", True,
+           "column", "Nom. Sample Time"),
+    Metric("coverage", "Coverage", "C", "Sample Coverage", False),
+    Metric("similarity", "Similarity", "Sim",
+           "Sample Similarity", False, optional=True),
+    Metric("memory", "Memory", "M", "Sample Memory", True,
+           "column", "Nom. Sample Memory", optional=True),
+    Metric("roic", "ROIC", "ROIC", "ROIC", False, optional=True),
+    Metric("msoc", "MSOC", "MSOC", "MSOC", False, optional=True),
+    Metric("icst", "ICST", "ICST", "ICST", False, optional=True),
+    Metric("throughput", "Throughput", "TP",
+           "System Memory Throughput", False, "best", optional=True),
+    Metric("totalPauseTime", "Total Pause Time", "TPT",
+           "Total Pause Time", True, "best", optional=True),
+    Metric("averagePauseTime", "Average Pause Time", "APT",
+           "Average Pause Time", True, "best", optional=True)
+]
+baseMetrics = metricRegistry[:5]
+
+
+def getMetric(key):
+    ''' Returns the registered metric with the given key or None. '''
+    for metric in metricRegistry:
+        if metric.key == key:
+            return metric
+    return None
+
+
+def getMetrics(arguments):
+    ''' Returns the metrics that are scored: the five base metrics and all other metrics that are weighted or swept. '''
+    keys = [entry.partition("=")[0] for entry in (arguments.weights or []) + (arguments.sweep or [])
+            if not entry.endswith("=0")]
+    if arguments.sweepFile:
+        keys += list(pd.read_csv(arguments.sweepFile, sep=";", nrows=0).columns)
+    return baseMetrics + [metric for metric in metricRegistry[len(baseMetrics):] if metric.key in keys]
+
+
+def getPrioritization(arguments):
+    # Get size
+    size = 1
+    if arguments.samplesize:
+        size = arguments.samplesize
+    # Get runtime
+    time = 1
+    if arguments.sampletime:
+        time = arguments.sampletime
+    # Get coverage
+    coverage = 1
+    if arguments.samplecoverage:
+        coverage = arguments.samplecoverage
+    # Get similarity
+    similarity = 0
+    if arguments.samplesimilarity:
+        similarity = arguments.samplesimilarity
+    # Get memory
+    memory = 0
+    if arguments.samplememory:
+        memory = arguments.samplememory
+    prioritization = Prioritization(size, time, coverage, similarity, memory)
+    # Get weights of further metrics
+    for entry in arguments.weights or []:
+        key, _, weight = entry.partition("=")
+        if getMetric(key) is None:
+            print("Unknown metric: " + key)
+            exit()
+        prioritization.setWeight(key, float(weight))
+    return prioritization
+
+
+def getPrioritizationFromWeights(weights, metrics):
+    ''' Creates the prioritization of the given weights in the order of the given metrics. '''
+    prioritization = Prioritization(0, 0, 0, 0, 0)
+    for metric, weight in zip(metrics, weights):
+        prioritization.setWeight(metric.key, weight)
+    return prioritization
+
+
+def getPrioritizationLabels(weights, metrics):
+    ''' Returns the labels (str of the prioritization) of all rows of the given P x M weight matrix in the order of
+    the given metrics. Each distinct weight of a metric is formatted once. '''
+    weights = np.asarray(weights, dtype=float)
+    keys = [metric.key for metric in metrics]
+    labels = np.full(len(weights), "[", dtype=object)
+    prefixes = {"size": "S-", "time": ",T-", "coverage": ",C-", "similarity": ",Sim-", "memory": ",M-"}
+    for key in Prioritization.criteria + [key for key in keys if key not in Prioritization.criteria]:
+        if key not in keys:
+            labels = labels + prefixes[key] + "0"
+            continue
+        # Distinct bit patterns keep the sign of -0.0 like str does
+        bits, inverse = np.unique(weights[:, keys.index(key)].view(np.int64), return_inverse=True)
+        values = bits.view(float).tolist()
+        if key in prefixes:
+            pieces = [prefixes[key] + str(value) for value in values]
+        else:
+            pieces = ["," + metrics[keys.index(key)].label + "-" + str(value) if value != 0 else ""
+                      for value in values]
+        labels = labels + np.array(pieces, dtype=object)[inverse.ravel()]
+    return labels + "]"
+
+
+def getSweepWeights(arguments, metrics):
+    ''' Returns the P x M weight matrix of the sweep over the given metrics, either read from the sweep file or as
+    grid of the sweep ranges. Metrics without a range or column keep the weight of the base prioritization. '''
+    base = getPrioritization(arguments).getWeights(metrics)
+    keys = [metric.key for metric in metrics]
+
+    if arguments.sweepFile:
+        table = pd.read_csv(arguments.sweepFile, sep=";")
+        return np.column_stack([table[key].values if key in table.columns else np.full(len(table), base[index])
+                                for index, key in enumerate(keys)]).astype(float)
+
+    values = [[weight] for weight in base]
+    for entry in arguments.sweep:
+        criterion, _, valueRange = entry.partition("=")
+        if criterion not in keys:
+            print("Unknown criterion in sweep: " + criterion)
+            exit()
+        values[keys.index(criterion)] = getSweepRange(valueRange)
+
+    grid = np.meshgrid(*values, indexing="ij")
+    return np.stack([axis.ravel() for axis in grid], axis=-1).astype(float)
+
+
+def getSweepRange(valueRange):
+    ''' Parses a range "start:end[:step]" (end included) or a list "a,b,c" of weights. Raises a ValueError for
+    malformed or empty ranges. '''
+    if ":" in valueRange:
+        bounds = [float(value) for value in valueRange.split(":")]
+        if len(bounds) > 3:
+            raise ValueError("expected start:end[:step]")
+        step = bounds[2] if len(bounds) > 2 else 1.0
+        if not all(math.isfinite(value) for value in bounds):
+            raise ValueError("the bounds and the step have to be finite")
+        if step <= 0:
+            raise ValueError("the step has to be positive")
+        if bounds[0] > bounds[1]:
+            raise ValueError("the start is above the end")
+        return np.arange(bounds[0], bounds[1] + step / 2, step)
+    values = [float(value) for value in valueRange.split(",")]
+    if not all(math.isfinite(value) for value in values):
+        raise ValueError("the weights have to be finite")
+    return values
+
+
+def getSearchWeights(method, samples, steps, seed=None, dimensions=5):
+    ''' Returns the weight vectors of the search in the weight space [0, 1]^dimensions, either as grid with the given
+    number of steps per criterion or as the given number of uniformly random samples. The zero vector is omitted. '''
+    if method == "grid":
+        axis = np.linspace(0, 1, steps)
+        grid = np.meshgrid(*([axis] * dimensions), indexing="ij")
+        weights = np.stack([values.ravel() for values in grid], axis=-1)
+    else:
+        weights = np.random.default_rng(seed).random(
+            (samples, dimensions))
+    return weights[weights.any(axis=1)]
+
+
+class Prioritization:
+    ''' A simple data class containing information of the prioritization of the user. '''
+    # Names of the criteria in the order of the weights
+    criteria = ["size", "time", "coverage", "similarity", "memory"]
+    size = 1.0
+    time = 1.0
+    coverage = 1.0
+    memory = 0.0
+    similarity = 0.0
+    extra = {}  # Weights of further metrics by their key
+
+    def __init__(self, size, time, coverage, similarity, memory):
+        self.size = size
+        self.time = time
+        self.coverage = coverage
+        self.similarity = similarity
+        self.memory = memory
+        self.extra = {}
+
+    def copy(self):
+        prioritization = Prioritization(self.size, self.time, self.coverage, self.similarity, self.memory)
+        prioritization.extra = dict(self.extra)
+        return prioritization
+
+    def __str__(self):
+        extra = "".join("," + getMetric(key).label + "-" + str(weight)
+                        for key, weight in self.extra.items() if weight != 0)
+        return "[S-" + str(self.size) + ",T-" + str(self.time) + ",C-" + str(self.coverage) + ",Sim-" + str(self.similarity) + ",M-" + str(self.memory) + extra + "]"
+
+    def printExlusively(self, exclusive):
+        if exclusive == "size":
+            return "[T-" + str(self.time) + ",C-" + str(self.coverage) + ",Sim-" + str(self.similarity) + ",M-" + str(self.memory) + "]"
+        elif exclusive == "time":
+            return "[S-" + str(self.size) + ",C-" + str(self.coverage) + ",Sim-" + str(self.similarity) + ",M-" + str(self.memory) + "]"
+        elif exclusive == "coverage":
+            return "[S-" + str(self.size) + ",T-" + str(self.time) + ",Sim-" + str(self.similarity) + ",M-" + str(self.memory) + "]"
+        elif exclusive == "similarity":
+            return "[S-" + str(self.size) + ",T-" + str(self.time) + ",C-" + str(self.coverage) + ",M-" + str(self.memory) + "]"
+        elif exclusive == "memory":
+            return "[S-" + str(self.size) + ",T-" + str(self.time) + ",C-" + str(self.coverage) + ",Sim-" + str(self.similarity) + "]"
+
+    def identical(self, other):
+        ''' Compares the given prioritization if they are identical. '''
+        return self.size == other.size and self.time == other.time and self.coverage == other.coverage and self.memory == other.memory and self.similarity == other.similarity and \
+            {key: weight for key, weight in self.extra.items() if weight != 0} == \
+            {key: weight for key, weight in other.extra.items() if weight != 0}
+
+    def getWeights(self, metrics=None):
+        ''' Returns the weights in the order of the given metrics, by default of the criteria (size, time, coverage,
+        similarity, memory). '''
+        if metrics is None:
+            return [getattr(self, criterion) for criterion in self.criteria]
+        return [self.getWeight(metric.key) for metric in metrics]
+
+    def getWeight(self, key):
+        ''' Returns the weight of the metric with the given key. '''
+        if key in self.criteria:
+            return getattr(self, key)
+        return self.extra.get(key, 0)
+
+    def setWeight(self, key, weight):
+        ''' Sets the weight of the metric with the given key. '''
+        if key in self.criteria:
+            setattr(self, key, weight)
+        else:
+            self.extra[key] = weight
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# Scores
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+# Metrics in the order of the registry, True if lower values are better
+criteriaLowerIsBetter = np.array(
+    [metric.lowerIsBetter for metric in metricRegistry])
+# Metrics that are skipped in the NBS if their subscore is missing
+criteriaOptional = np.array([metric.optional for metric in metricRegistry])
+
+
+def denseRank(values, ascending=True):
+    ''' Dense ranks the values along the last axis, the ranking of all scores and subscores. Equal values share a rank
+    and all missing values share the rank after the last valued one. ascending may be an array that broadcasts
+    against the leading axes. '''
+    values = np.asarray(values, dtype=float)
+    keys = np.where(np.expand_dims(ascending, -1), values, -values)
+
+    # Sort (missing values last) and start a new rank whenever the value changes
+    order = np.argsort(keys, axis=-1, kind="stable")
+    sortedKeys = np.take_along_axis(keys, order, axis=-1)
+    changed = (sortedKeys[..., 1:] != sortedKeys[..., :-1]) & \
+        ~(np.isnan(sortedKeys[..., 1:]) & np.isnan(sortedKeys[..., :-1]))
+    steps = np.concatenate(
+        [np.ones(sortedKeys[..., :1].shape, dtype=int), changed.astype(int)], axis=-1)
+
+    ranks = np.empty(keys.shape, dtype=int)
+    np.put_along_axis(ranks, order, np.cumsum(steps, axis=-1), axis=-1)
+    return ranks
+
+
+def calculateScoreMatrices(weights, averages, normalized, lowerIsBetter=None, optional=None):
+    ''' Calculates the NBS, SRBS, WRBS and IWRBS of every pair of prioritization and algorithm in one pass.
+    weights is a P x M matrix of prioritizations, averages is the A x M matrix of averaged metrics and normalized
+    is the A x M matrix of NBS subscores, all in the same metric order. lowerIsBetter and optional describe these
+    metrics and default to the first M metrics of the registry. Returns the P x A scores and ranks and the P x A x M
+    subscores keyed like the columns of the averaged header. averages and normalized may have leading group axes
+    (e.g. S x A x M for S systems), which are scored independently into S x P x A results. '''
+    weights = np.asarray(weights, dtype=float)[:, np.newaxis, :]
+    if lowerIsBetter is None:
+        lowerIsBetter = criteriaLowerIsBetter[:weights.shape[-1]]
+    if optional is None:
+        optional = criteriaOptional[:weights.shape[-1]]
+    averages = np.asarray(averages, dtype=float)[..., np.newaxis, :, :]
+    normalized = np.asarray(normalized, dtype=float)[..., np.newaxis, :, :]
+    shape = np.broadcast(weights, averages).shape
+    weighted = weights != 0
+    scores = {}
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # NBS (highest best), optional criteria are skipped if missing
+        terms = weights * normalized
+        terms = np.where(optional & np.isnan(normalized), 0, terms)
+        scores["NBS Subscore"] = np.broadcast_to(normalized, shape)
+        scores["NBS"] = terms.sum(axis=-1)
+
+        # SRBS (lowest best), the subscores are the ranks of the averages
+        subscores = denseRank(np.swapaxes(averages, -1, -2), lowerIsBetter)
+        subscores = np.swapaxes(subscores, -1, -2)
+        scores["SRBS Subscore"] = np.broadcast_to(subscores, shape)
+        scores["SRBS"] = (weights * subscores).sum(axis=-1)
+
+        # WRBS (lowest best) and IWRBS (highest best) relative to the best and worst average
+        minimum = np.fmin.reduce(averages, axis=-2, initial=np.nan, keepdims=True)
+        maximum = np.fmax.reduce(averages, axis=-2, initial=np.nan, keepdims=True)
+        subscores = np.where(lowerIsBetter,
+                             averages / minimum, maximum / averages)
+        scores["WRBS Subscore"] = np.where(weighted, subscores, np.nan)
+        scores["WRBS"] = np.where(weighted, weights * subscores, 0).sum(axis=-1)
+        subscores = np.where(lowerIsBetter,
+                             maximum / averages, averages / minimum)
+        scores["IWRBS Subscore"] = np.where(weighted, subscores, np.nan)
+        scores["IWRBS"] = np.where(weighted, weights * subscores, 0).sum(axis=-1)
+
+    # Ranks of each prioritization
+    scores["NBS Rank"] = denseRank(scores["NBS"], ascending=False)
+    scores["SRBS Rank"] = denseRank(scores["SRBS"], ascending=True)
+    scores["WRBS Rank"] = denseRank(scores["WRBS"], ascending=True)
+    scores["IWRBS Rank"] = denseRank(scores["IWRBS"], ascending=False)
+    return scores
+
+
+def mannWhitneyMatrices(counts):
+    ''' Two-sided Mann-Whitney U tests of all pairs of algorithms for M metrics at once. counts is the M x A x K
+    matrix of how often each algorithm has each of the K sorted distinct values of a metric. Returns the M x A x A U
+    statistics of the row against the column algorithm, their p-values (normal approximation with tie and continuity
+    correction) and the Vargha-Delaney A12, i.e. the probability that the row algorithm has the larger value. '''
+    counts = np.asarray(counts, dtype=float)
+    transposed = np.swapaxes(counts, -1, -2)
+    below = np.cumsum(counts, axis=-1) - counts
+    u = counts @ np.swapaxes(below, -1, -2) + 0.5 * (counts @ transposed)
+
+    # Sizes and tie correction of the union of each pair
+    sizes = counts.sum(axis=-1)
+    rows, columns = sizes[..., :, np.newaxis], sizes[..., np.newaxis, :]
+    cubes = (counts ** 3).sum(axis=-1)
+    ties = cubes[..., :, np.newaxis] + cubes[..., np.newaxis, :] + \
+        3 * ((counts ** 2) @ transposed) + 3 * (counts @ np.swapaxes(counts ** 2, -1, -2)) - rows - columns
+    total = rows + columns
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = rows * columns / 12 * \
+            ((total + 1) - ties / (total * (total - 1)))
+        z = np.maximum(np.abs(u - rows * columns / 2) - 0.5, 0) / np.sqrt(variance)
+        pValues = np.frompyfunc(math.erfc, 1, 1)(z / math.sqrt(2)).astype(float)
+        # Identical samples can not be told apart
+        pValues = np.where((variance <= 0) & (rows > 0) & (columns > 0), 1, pValues)
+        a12 = u / (rows * columns)
+    return u, pValues, a12
+
+
+def holmCorrection(pValues):
+    ''' Adjusts the given p-values with the Holm-Bonferroni step-down procedure. Missing p-values are not counted. '''
+    pValues = np.asarray(pValues, dtype=float)
+    tested = ~np.isnan(pValues)
+    order = np.argsort(pValues[tested], kind="stable")
+    factors = tested.sum() - np.arange(tested.sum())
+    adjusted = np.minimum(np.maximum.accumulate(
+        pValues[tested][order] * factors), 1)
+
+    result = np.full(pValues.shape, np.nan)
+    result[np.flatnonzero(tested)[order]] = adjusted
+    return result
+
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# SamplingFrame
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SamplingFrame:
+    ''' Data class containing all data '''
+
+    # Header for the average overview
+    headerAveraged = [
+        "Prioritization",
+        "Algorithm",
+        "NBS",
+        "NBS Rank",
+        "SRBS",
+        "SRBS Rank",
+        "WRBS",
+        "WRBS Rank",
+        "IWRBS",
+        "IWRBS Rank",
+        "Avg. Size",
+        "Avg. Time",
+        "Avg. Coverage",
+        "Avg. Similarity",
+        "Avg. Memory",
+        "Avg. Normalized Size",
+        "Avg. Normalized Time",
+        "Avg. Normalized Memory",
+        "NBS Subscore Size",
+        "NBS Subscore Time",
+        "NBS Subscore Coverage",
+        "NBS Subscore Similarity",
+        "NBS Subscore Memory",
+        "SRBS Subscore Size",
+        "SRBS Subscore Time",
+        "SRBS Subscore Coverage",
+        "SRBS Subscore Similarity",
+        "SRBS Subscore Memory",
+        "WRBS Subscore Size",
+        "WRBS Subscore Time",
+        "WRBS Subscore Coverage",
+        "WRBS Subscore Similarity",
+        "WRBS Subscore Memory",
+        "IWRBS Subscore Size",
+        "IWRBS Subscore Time",
+        "IWRBS Subscore Coverage",
+        "IWRBS Subscore Similarity",
+        "IWRBS Subscore Memory"
+    ]
+
+    # Header for all entries
+    header = [
+        "Author",
+        "Algorithm",
+        "T-Wise",
+        "System Name",
+        "System Features",
+        "System Constraints",
+        "System Iteration",
+        "System Interactions",
+        "System Timeout",
+        "System Memory Throughput",
+        "Memory Created Bytes MB",
+        "Sample Size",
+        "Sample Time",
+        "Sample Coverage",
+        "Sample Similarity",
+        "Sample Memory",
+        "ROIC",
+        "MSOC",
+        "FIMD",
+        "ICST",
+        "Total Pause Time",
+        "Average Pause Time",
+        'Nom. Sample Size',
+        'Nom. Sample Time',
+        'Nom. Sample Memory',
+        "In Time",
+        "No Error"
+    ]
+
+    # Types of the header columns, the metric columns are float64 to keep the precision of the scores
+    headerTypes = {
+        "Author": "category",
+        "Algorithm": "category",
+        "T-Wise": "int32",
+        "System Name": "category",
+        "System Features": "int32",
+        "System Constraints": "int32",
+        "System Iteration": "int32",
+        "System Interactions": "int64",
+        "System Timeout": "int64",
+        "System Memory Throughput": "float64",
+        "Memory Created Bytes MB": "float64",
+        "Sample Size": "int64",
+        "Sample Time": "int64",
+        "Sample Coverage": "float64",
+        "Sample Similarity": "float64",
+        "Sample Memory": "float64",
+        "ROIC": "float64",
+        "MSOC": "float64",
+        "FIMD": "float64",
+        "ICST": "float64",
+        "Total Pause Time": "float64",
+        "Average Pause Time": "float64",
+        'Nom. Sample Size': "float64",
+        'Nom. Sample Time': "float64",
+        'Nom. Sample Memory': "float64",
+        "In Time": "bool",
+        "No Error": "bool"
+    }
+
+    # Mapping of the header onto the columns of the raw result files
+    headerMapping = {
+        "Author": "Author",
+        "Algorithm": "AlgorithmID",
+        "T-Wise": "T-Value",
+        "System Name": "ModelName",
+        "System Features": "Model_Features",
+        "System Constraints": "Model_Constraints",
+        "System Iteration": "SystemIteration",
+        "System Interactions": "Valid Conditions",
+        "System Timeout": "Timeout",
+        "System Memory Throughput": "Throughput",
+        "Memory Created Bytes MB": "TotalCreatedBytes",
+        "Sample Size": "Size",
+        "Sample Time": "Time",
+        "Sample Coverage": "Coverage",
+        "Sample Similarity": "FIMD",
+        "Sample Memory": "TotalCreatedBytes",
+        "ROIC": "ROIC",
+        "MSOC": "MSOC",
+        "FIMD": "FIMD",
+        "ICST": "ICST",
+        "Total Pause Time": "TotalPauseTime",
+        "Average Pause Time": "AveragePauseTime"
+    }
+
+    # Mapping of the averaged columns onto the columns of the sampling data
+    averageMapping = {
+        "Avg. Size": "Sample Size",
+        "Avg. Time": "Sample Time",
+        "Avg. Coverage": "Sample Coverage",
+        "Avg. Similarity": "Sample Similarity",
+        "Avg. Memory": "Sample Memory",
+        "Avg. Normalized Size": "Nom. Sample Size",
+        "Avg. Normalized Time": "Nom. Sample Time",
+        "Avg. Normalized Memory": "Nom. Sample Memory"
+    }
+
+    # Criteria of the scores in the order of the prioritization weights. The averaged header and columns above and
+    # the criteria describe the base metrics, setMetrics derives them for further metrics of the registry
+    metrics = baseMetrics
+    lowerIsBetter = criteriaLowerIsBetter[:len(baseMetrics)]
+    optional = criteriaOptional[:len(baseMetrics)]
+    criteria = ["Size", "Time", "Coverage", "Similarity", "Memory"]
+    criteriaAveraged = ["Avg. Size", "Avg. Time",
+                        "Avg. Coverage", "Avg. Similarity", "Avg. Memory"]
+    criteriaNormalized = ["Avg. Normalized Size", "Avg. Normalized Time",
+                          "Avg. Coverage", "Avg. Similarity", "Avg. Normalized Memory"]
+
+    # Criteria with raw sampling columns that are tested pairwise for significant differences
+    testedColumns = {
+        "Size": "Sample Size",
+        "Time": "Sample Time",
+        "Memory": "Sample Memory"
+    }
+
+    # Rank columns of the scores with the ranked score and whether lower scores are better
+    rankSources = {
+        "NBS Rank": ("NBS", False),
+        "SRBS Rank": ("SRBS", True),
+        "WRBS Rank": ("WRBS", True),
+        "IWRBS Rank": ("IWRBS", False)
+    }
+
+    # Columns of the raw result files that are required for the conversion
+    rawHeader = [
+        "Author",
+        "AlgorithmID",
+        "ModelName",
+        "Model_Features",
+        "Model_Constraints",
+        "SystemIteration",
+        "Timeout",
+        "Time",
+        "Size",
+        "T-Value",
+        "Valid Conditions",
+        "Coverage",
+        "ROIC",
+        "MSOC",
+        "FIMD",
+        "ICST",
+        "Throughput",
+        "TotalCreatedBytes",
+        "TotalPauseTime",
+        "AveragePauseTime",
+        "InTime",
+        "NoError"
+    ]
+
+    # Pattern of the product line and snapshot date in a system name, e.g. BusyBox_2009-08-01_00-40-45
+    snapshotPattern = r"^(.*?)[_\- ]*(\d{4}-\d{2}-\d{2})"
+
+    # Aggregators of the averaged columns and the share trimmed from each side by the trimmed mean
+    aggregates = ["mean", "median", "trimmed", "geometric"]
+    trimmedShare = 0.1
+
+    data = pd.DataFrame  # Contains
+    average = pd.DataFrame  # Contains the averaged data and scores
+    averagesCache = None  # Contains the averages of each algorithm for the loaded data
+    accumulator = None  # Contains the running sums of the incremental ingestion
+    ingestedFiles = {}  # Contains the read offset and header (or the rejection) of each incrementally ingested file
+    aggregate = "mean"  # Aggregator of the averaged columns
+    penalty = None  # PAR-k penalty factor of timed out and failed runs, None keeps their sentinels
+    extension = ".csv"
+
+    def __init__(self, aggregate="mean", penalty=None, metrics=baseMetrics):
+        self.aggregate = aggregate
+        self.penalty = penalty
+        self.setMetrics(metrics)
+        self.data = pd.DataFrame(columns=self.header).astype(self.headerTypes)
+        self.average = pd.DataFrame(columns=self.headerAveraged)
+        self.averagesCache = None
+        self.accumulator = None
+        self.ingestedFiles = {}
+
+    def setMetrics(self, metrics):
+        ''' Sets the scored metrics and derives the averaged header and columns from them. '''
+        self.metrics = list(metrics)
+        self.lowerIsBetter = np.array(
+            [metric.lowerIsBetter for metric in self.metrics])
+        self.optional = np.array([metric.optional for metric in self.metrics])
+        self.criteria = [metric.name for metric in self.metrics]
+        self.criteriaAveraged = ["Avg. " + name for name in self.criteria]
+        self.criteriaNormalized = ["Avg. Normalized " + metric.name if metric.normalization == "column" else "Avg. " + metric.name
+                                   for metric in self.metrics]
+
+        # Averages of the metric columns followed by the averages of the normalized columns
+        self.averageMapping = {"Avg. " + metric.name: metric.column
+                               for metric in self.metrics}
+        self.averageMapping.update({"Avg. Normalized " + metric.name: metric.normalizedColumn
+                                    for metric in self.metrics if metric.normalization == "column"})
+        self.headerAveraged = ["Prioritization", "Algorithm"] + \
+            [column for score in ["NBS", "SRBS", "WRBS", "IWRBS"] for column in [score, score + " Rank"]] + \
+            list(self.averageMapping.keys()) + \
+            [score + " Subscore " + name for score in ["NBS", "SRBS", "WRBS", "IWRBS"]
+             for name in self.criteria]
+        self.averagesCache = None
+
+    def getScoreInputs(self, values):
+        ''' Splits the averaged columns (..., A x C in the order of the averageMapping) into the averages and the NBS
+        subscores of the metrics (..., A x M each) as expected by calculateScoreMatrices. '''
+        values = np.asarray(values, dtype=float)
+        averages = values[..., self.getAverageIndices(self.criteriaAveraged)]
+        normalized = values[..., self.getAverageIndices(self.criteriaNormalized)]
+
+        # Metrics normalized by the best average of the algorithms
+        best = np.array([metric.normalization == "best" for metric in self.metrics])
+        if best.any():
+            with np.errstate(divide="ignore", invalid="ignore"):
+                minimum = np.fmin.reduce(averages, axis=-2, initial=np.nan, keepdims=True)
+                maximum = np.fmax.reduce(averages, axis=-2, initial=np.nan, keepdims=True)
+                ratios = np.where(self.lowerIsBetter, minimum / averages, averages / maximum)
+            normalized = np.where(best, ratios, normalized)
+        return averages, normalized
+
+    def scoreAverages(self, weights, values):
+        ''' Scores the given P x M weights against the averaged columns (..., A x C in the order of the averageMapping). '''
+        averages, normalized = self.getScoreInputs(values)
+        return calculateScoreMatrices(weights, averages, normalized, self.lowerIsBetter, self.optional)
+
+    def getData(self):
+        return self.data
+
+    def getAverageData(self):
+        return self.average
+
+    def saveAverage(self, absoluteSavePath):
+        ''' Computes the average overview and saves it accordingly. '''
+        # Remove old file
+        if os.path.isfile(absoluteSavePath + self.extension):
+            os.remove(absoluteSavePath + self.extension)
+
+        # Save new version
+        self.average.to_csv(absoluteSavePath + self.extension, sep=";")
+
+    def save(self, absoluteSavePath):
+        ''' Saves all data as csv object. The given path should not contain any extension. '''
+        # Remove old file
+        if os.path.isfile(absoluteSavePath + self.extension):
+            os.remove(absoluteSavePath + self.extension)
+
+        # Save new version
+        self.data.to_csv(absoluteSavePath + self.extension, sep=";")
+
+    def computeScores(self, absoluteSavePath, prioritizationList):
+        ''' Computes all subscores and scores and saves the results in the respective output folder. '''
+        # Clean average object
+        self.average = self.average.iloc[0:0]
+
+        # Compute everything for all prioritizations
+        self.calculate_Batch(prioritizationList)
+
+        # Save data
+        self.saveAverage(absoluteSavePath + "_averaged")
+
+    def calculate_Batch(self, prioritizationList):
+        ''' Calculates the averages, all scores, subscores and ranks for all given prioritizations in one vectorized pass. '''
+        self.average = self.scoreTable(
+            prioritizationList, self.getAlgorithmAverages())
+
+    def scoreTable(self, prioritizationList, averages):
+        ''' Scores the given averages (indexed by the algorithm) for all given prioritizations. Returns one row per
+        prioritization and algorithm with the columns of the averaged header. '''
+        weights = np.array([prio.getWeights(self.metrics)
+                            for prio in prioritizationList], dtype=float).reshape(-1, len(self.criteria))
+        scores = self.scoreAverages(weights, averages.values)
+
+        # One row per prioritization and algorithm, the columns are collected first and the frame is built once
+        prioritizations = len(prioritizationList)
+        average = {
+            "Prioritization": np.repeat([str(prio) for prio in prioritizationList], len(averages)),
+            "Algorithm": np.tile(averages.index.values, prioritizations)
+        }
+        for column in averages.columns:
+            average[column] = np.tile(averages[column].values, prioritizations)
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            average[score] = scores[score].ravel()
+            average[score + " Rank"] = scores[score + " Rank"].ravel()
+            for index, criterion in enumerate(self.criteria):
+                average[score + " Subscore " + criterion] = \
+                    scores[score + " Subscore"][..., index].ravel()
+        return pd.DataFrame(average)[self.headerAveraged]
+
+    def calculate_Sweep(self, weights, jobs=1):
+        ''' Scores all prioritizations of the given P x M weight matrix in batched passes. Returns a long-format
+        table with one row per prioritization, algorithm and score. With more than one job (0 = all cores) the weights
+        are split across processes that share the score inputs read-only through a memory-mapped file and each build
+        the table of their chunk. '''
+        averages = self.getAlgorithmAverages()
+        weights = np.asarray(weights, dtype=float).reshape(-1, len(self.criteria))
+        inputs = np.hstack(self.getScoreInputs(averages.values))
+        algorithms = averages.index.values
+        if jobs == 1 or len(weights) < 2:
+            chunks = [getSweepTables(weights, inputs, algorithms, self.metrics, self.lowerIsBetter, self.optional)]
+        else:
+            workers = os.cpu_count() if jobs <= 0 else jobs
+            weightChunks = [chunk for chunk in np.array_split(weights, workers * 4)
+                            if len(chunk) > 0]
+            with tempfile.TemporaryDirectory() as directory:
+                inputsPath = os.path.join(directory, "inputs.npy")
+                np.save(inputsPath, inputs)
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks = list(executor.map(
+                        scoreSweepChunk, [inputsPath] * len(weightChunks), weightChunks,
+                        [algorithms] * len(weightChunks), [self.metrics] * len(weightChunks),
+                        [self.lowerIsBetter] * len(weightChunks), [self.optional] * len(weightChunks)))
+
+        # All rows of a score in the order of the weights
+        return pd.concat([chunk[score] for score in ["NBS", "SRBS", "WRBS", "IWRBS"] for chunk in chunks],
+                         ignore_index=True)
+
+    def searchPrioritizations(self, weights, chunkSize=10000):
+        ''' Scores all given weight vectors in vectorized chunks and reports for each score and algorithm how often
+        and in which weight region the algorithm ranks first. Tied first ranks count for all tied algorithms. '''
+        averages = self.getAlgorithmAverages()
+        algorithms = len(averages)
+        scoreNames = ["NBS", "SRBS", "WRBS", "IWRBS"]
+        wins = {score: np.zeros(algorithms) for score in scoreNames}
+        sums = {score: np.zeros((algorithms, len(self.criteria)))
+                for score in scoreNames}
+        minima = {score: np.full((algorithms, len(self.criteria)), np.inf)
+                  for score in scoreNames}
+        maxima = {score: np.full((algorithms, len(self.criteria)), -np.inf)
+                  for score in scoreNames}
+
+        for start in range(0, len(weights), chunkSize):
+            chunk = np.asarray(weights[start:start + chunkSize], dtype=float)
+            scores = self.scoreAverages(chunk, averages.values)
+            for score in scoreNames:
+                # P x A matrix of first ranks
+                first = scores[score + " Rank"] == 1
+                wins[score] += first.sum(axis=0)
+                sums[score] += first.T.astype(float) @ chunk
+                region = np.where(first[:, :, np.newaxis],
+                                  chunk[:, np.newaxis, :], np.nan)
+                minima[score] = np.fmin(minima[score], np.fmin.reduce(
+                    region, axis=0, initial=np.nan))
+                maxima[score] = np.fmax(maxima[score], np.fmax.reduce(
+                    region, axis=0, initial=np.nan))
+
+        tables = []
+        for score in scoreNames:
+            table = pd.DataFrame({"Score": score,
+                                  "Algorithm": averages.index.values,
+                                  "Wins": wins[score].astype(int),
+                                  "Share": wins[score] / max(len(weights), 1)})
+            with np.errstate(invalid="ignore"):
+                means = sums[score] / wins[score][:, np.newaxis]
+            for index, criterion in enumerate(self.criteria):
+                hasWins = wins[score] > 0
+                table[criterion + " Min"] = np.where(
+                    hasWins, minima[score][:, index], np.nan)
+                table[criterion + " Max"] = np.where(
+                    hasWins, maxima[score][:, index], np.nan)
+                table[criterion + " Mean"] = means[:, index]
+            tables.append(table)
+        return pd.concat(tables, ignore_index=True)
+
+    def getParetoFront(self):
+        ''' Determines the Pareto-optimal algorithms over the averaged criteria. A missing average counts as the worst value. '''
+        averages = self.getAlgorithmAverages()
+
+        # Turn all criteria into lowest best, missing values are worst
+        values = averages[self.criteriaAveraged].values.astype(float)
+        values = np.where(self.lowerIsBetter, values, -values)
+        values = np.where(np.isnan(values), np.inf, values)
+
+        # A x A matrix, True if the row algorithm dominates the column algorithm
+        notWorse = (values[:, np.newaxis, :] <= values[np.newaxis, :, :]).all(axis=-1)
+        better = (values[:, np.newaxis, :] < values[np.newaxis, :, :]).any(axis=-1)
+        dominates = notWorse & better
+
+        names = averages.index.values
+        return pd.DataFrame({
+            "Algorithm": names,
+            "Pareto Optimal": ~dominates.any(axis=0),
+            "Dominated By": [", ".join(names[dominates[:, index]]) for index in range(len(names))]
+        })
+
+    def calculate_PerSystem(self, prioritization):
+        ''' Scores the algorithms on every system separately in one vectorized pass and aggregates their ranks over
+        the systems. Returns the scores of each system and algorithm and, for every score, the average rank, the win
+        count and the rank of the average rank of each algorithm. Systems without results of an algorithm are skipped
+        for that algorithm. '''
+        systems, algorithms, averages, present = self.computeGroupAverages(
+            self.data['System Name'])
+        scores = self.scoreAverages(
+            [prioritization.getWeights(self.metrics)], averages)
+
+        # One row per system and algorithm that has results
+        systemScores = pd.DataFrame({
+            "System Name": np.repeat(systems, len(algorithms)),
+            "Algorithm": np.tile(algorithms, len(systems))
+        })
+        aggregates = []
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            # S x A ranks, missing where a system lacks the algorithm
+            ranks = np.where(present, scores[score + " Rank"][:, 0, :], np.nan)
+            systemScores[score] = scores[score][:, 0, :].ravel()
+            systemScores[score + " Rank"] = ranks.ravel()
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                averageRanks = np.nansum(ranks, axis=0) / present.sum(axis=0)
+            aggregates.append(pd.DataFrame({
+                "Score": score,
+                "Algorithm": algorithms,
+                "Systems": present.sum(axis=0),
+                "Average Rank": averageRanks,
+                "Wins": (ranks == 1).sum(axis=0),
+                "Rank": denseRank(averageRanks)
+            }))
+        systemScores = systemScores[present.ravel()].reset_index(drop=True)
+        systemScores = systemScores.astype({score + " Rank": int for score in
+                                            ["NBS", "SRBS", "WRBS", "IWRBS"]})
+        return systemScores, pd.concat(aggregates, ignore_index=True)
+
+    def computePairwiseTests(self):
+        ''' Tests all pairs of algorithms on the raw rows of every tested criterion in one batched pass. Negative
+        sentinels are skipped. Returns the M x A x A U statistics, p-values, Holm adjusted p-values over all metrics
+        and pairs, A12 effect sizes and the M x A sample sizes in the order of testedColumns. '''
+        averages = self.getAlgorithmAverages()
+        codes = averages.index.get_indexer(self.data['Algorithm'].astype(object))
+
+        # M x A x K value counts, padded to the largest number of distinct values
+        metrics = []
+        samplingValues = self.getSamplingValues(self.data)
+        for column in self.testedColumns.values():
+            values = samplingValues[column].values
+            valid = ~np.isnan(values)
+            distinct, inverse = np.unique(values[valid], return_inverse=True)
+            metrics.append(np.bincount(codes[valid] * len(distinct) + inverse,
+                                       minlength=len(averages) * len(distinct)).reshape(len(averages), len(distinct)))
+        width = max([counts.shape[1] for counts in metrics] + [1])
+        counts = np.stack([np.pad(counts, ((0, 0), (0, width - counts.shape[1])))
+                           for counts in metrics])
+        u, pValues, a12 = mannWhitneyMatrices(counts)
+
+        # Correct over the distinct pairs of all metrics, the matrices are symmetric
+        upper = np.triu(np.ones(pValues.shape[1:], dtype=bool), k=1)
+        adjusted = np.full(pValues.shape, np.nan)
+        adjusted[:, upper] = holmCorrection(
+            pValues[:, upper].ravel()).reshape(len(metrics), -1)
+        adjusted = np.fmin(adjusted, np.swapaxes(adjusted, -1, -2))
+        return {"U": u, "P": pValues, "P Adjusted": adjusted, "A12": a12, "N": counts.sum(axis=-1)}
+
+    def calculate_Significance(self, alpha=0.05):
+        ''' Returns the pairwise tests of the tested criteria as a table with one row per criterion and pair of algorithms. '''
+        algorithms = self.getAlgorithmAverages().index.values
+        tests = self.computePairwiseTests()
+        first, second = np.triu_indices(len(algorithms), k=1)
+
+        tables = []
+        for index, criterion in enumerate(self.testedColumns):
+            tables.append(pd.DataFrame({
+                "Criterion": criterion,
+                "Algorithm A": algorithms[first],
+                "Algorithm B": algorithms[second],
+                "N A": tests["N"][index, first].astype(int),
+                "N B": tests["N"][index, second].astype(int),
+                "U": tests["U"][index, first, second],
+                "A12": tests["A12"][index, first, second],
+                "p": tests["P"][index, first, second],
+                "p Holm": tests["P Adjusted"][index, first, second],
+                "Significant": tests["P Adjusted"][index, first, second] < alpha
+            }))
+        return pd.concat(tables, ignore_index=True)
+
+    def calculate_TiedRanks(self, prioritizationList, alpha=0.05):
+        ''' Replaces the ranks of the scores computed by calculate_Batch for the given prioritizations with
+        statistically tied ranks. The rank of an algorithm is one plus the
+        number of algorithms with a better score that differ from it in a weighted criterion, where tested criteria
+        only differ if the test is significant at the given level and the other criteria if their averages differ. '''
+        averages = self.getAlgorithmAverages()
+        algorithms = len(averages)
+        prioritizations = len(prioritizationList)
+        tests = self.computePairwiseTests()
+
+        # 5 x A x A matrix, True if a pair differs in the criterion
+        values = averages[self.criteriaAveraged].values.astype(float).T
+        differs = ~((values[:, :, np.newaxis] == values[:, np.newaxis, :]) |
+                    (np.isnan(values[:, :, np.newaxis]) & np.isnan(values[:, np.newaxis, :])))
+        for index, criterion in enumerate(self.testedColumns):
+            differs[self.criteria.index(criterion)] = tests["P Adjusted"][index] < alpha
+
+        # P x A x A, True if the pair differs in any weighted criterion of the prioritization
+        weighted = np.array([prio.getWeights(self.metrics)
+                             for prio in prioritizationList]) != 0
+        distinct = np.einsum("pc,cab->pab", weighted.astype(int), differs.astype(int)) > 0
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            lowerIsBetter = self.rankSources[score + " Rank"][1]
+            keys = self.average[score].values.astype(float).reshape(prioritizations, algorithms)
+            keys = np.where(np.isnan(keys), np.inf, keys if lowerIsBetter else -keys)
+            better = keys[:, np.newaxis, :] < keys[:, :, np.newaxis]
+            self.average[score + " Rank"] = (1 + (better & distinct).sum(axis=-1)).ravel()
+
+    def calculate_Sensitivity(self, prioritization):
+        ''' Analyses how the ranks react to the weight of each metric while the other weights stay fixed. All scores
+        are linear in a single weight, so two algorithms swap their order exactly where their score lines cross.
+        An algorithm without a finite subscore of a metric scores missing (last) or infinite at every positive weight
+        of it, so its order to the others can also change at weight 0 itself. A missing score is never on top and an
+        interval that excludes weight 0 for this reason starts at the smallest positive weight.
+        Returns all crossover weights (>= 0) of each score, metric and pair of algorithms and the interval of each
+        weight in which the current top-ranked algorithms of each score stay on top. '''
+        averages = self.getAlgorithmAverages()
+        algorithms = averages.index.values
+        weights = np.array(prioritization.getWeights(self.metrics), dtype=float)
+
+        # Scores at the current weights, the unmasked A x M subscores (slopes) of each score and the scores with the
+        # weight of each metric set to 0 (M x A intercepts)
+        scores = self.scoreAverages([weights], averages.values)
+        slopes = self.scoreAverages([np.ones(len(weights))], averages.values)
+        zeroed = np.where(np.eye(len(weights), dtype=bool), 0, weights)
+        intercepts = self.scoreAverages(zeroed, averages.values)
+        first, second = np.triu_indices(len(algorithms), k=1)
+
+        crossovers = []
+        stability = []
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            slope = slopes[score + " Subscore"][0].T
+            if score == "NBS":
+                slope = np.where(self.optional[:, np.newaxis] & np.isnan(slope), 0, slope)
+            intercept = intercepts[score]
+
+            # Algorithms without a finite score line are missing or infinite at every positive weight, the order of
+            # a pair with such an algorithm can only change at weight 0 (1 if the row algorithm is better)
+            lowerIsBetter = self.rankSources[score + " Rank"][1]
+            lineless = ~(np.isfinite(slope) & np.isfinite(intercept))
+            aboveZero = np.where(lineless, intercept + slope, intercept)
+            ranksAtZero = denseRank(intercept, lowerIsBetter)
+            ranksAboveZero = denseRank(aboveZero, lowerIsBetter)
+            orderAtZero = np.sign(ranksAtZero[:, np.newaxis, :] - ranksAtZero[:, :, np.newaxis])
+            orderAboveZero = np.sign(ranksAboveZero[:, np.newaxis, :] - ranksAboveZero[:, :, np.newaxis])
+            mixed = lineless[:, :, np.newaxis] | lineless[:, np.newaxis, :]
+            jump = mixed & (orderAtZero != orderAboveZero)
+
+            # M x A x A weight where the score lines of the row and the column algorithm cross, the score at weight t
+            # is intercept + t * slope
+            with np.errstate(invalid="ignore", divide="ignore"):
+                crossing = (intercept[:, np.newaxis, :] - intercept[:, :, np.newaxis]) / \
+                    (slope[:, :, np.newaxis] - slope[:, np.newaxis, :])
+            crossing[mixed] = np.nan
+            crossing[jump] = 0
+
+            valid = np.isfinite(crossing[:, first, second]) & (
+                crossing[:, first, second] >= 0)
+            metricIndex, pairIndex = np.nonzero(valid)
+            crossovers.append(pd.DataFrame({
+                "Score": score,
+                "Metric": np.array(self.criteria)[metricIndex],
+                "Algorithm A": algorithms[first[pairIndex]],
+                "Algorithm B": algorithms[second[pairIndex]],
+                "Crossover Weight": crossing[:, first, second][valid],
+                "Current Weight": weights[metricIndex]
+            }))
+
+            # Interval in which each valued top algorithm beats all others, better scores are higher after the sign flip
+            sign = -1 if lowerIsBetter else 1
+            for top in np.flatnonzero((scores[score + " Rank"][0] == 1) & ~np.isnan(scores[score][0])):
+                with np.errstate(invalid="ignore"):
+                    gap = sign * (slope[:, top, np.newaxis] - slope)
+                    bounds = np.where(mixed[:, top], np.nan, crossing[:, top, :])
+                    lower = np.where((gap > 0) & np.isfinite(bounds), bounds, -np.inf)
+                    upper = np.where((gap < 0) & np.isfinite(bounds), bounds, np.inf)
+                # Missing or beaten just above weight 0 (only possible at the current weight 0) or beaten only at 0
+                upper = np.where((jump[:, top] & (orderAboveZero[:, top] < 0)) |
+                                 np.isnan(aboveZero[:, top, np.newaxis]), 0, upper)
+                lower = np.where(jump[:, top] & (orderAtZero[:, top] < 0), np.nextafter(0, 1), lower)
+                lower[:, top] = -np.inf
+                upper[:, top] = np.inf
+                stability.append(pd.DataFrame({
+                    "Score": score,
+                    "Algorithm": algorithms[top],
+                    "Metric": self.criteria,
+                    "Current Weight": weights,
+                    "Stable From": np.maximum(lower.max(axis=1), 0),
+                    "Stable To": upper.min(axis=1)
+                }))
+        return pd.concat(crossovers, ignore_index=True), pd.concat(stability, ignore_index=True)
+
+    def calculate_WhatIf(self, prioritization):
+        ''' Computes for each score, weighted metric and algorithm the averaged value of the metric at which the
+        algorithm would tie each algorithm ranked above it, with all other averages fixed. The NBS of a metric with a
+        normalized column changes through the average of that column. The thresholds are solved for all pairs of
+        algorithms at once, values that can not be reached are missing. '''
+        averages = self.getAlgorithmAverages()
+        algorithms = averages.index.values
+        weights = np.array(prioritization.getWeights(self.metrics), dtype=float)
+        values, normalized = self.getScoreInputs(averages.values)
+        scores = self.scoreAverages([weights], averages.values)
+
+        tables = []
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            # Losses (lower is better) of the current scores
+            sign = 1 if self.rankSources[score + " Rank"][1] else -1
+            loss = sign * scores[score][0]
+            ranks = scores[score + " Rank"][0]
+            subscores = scores[score + " Subscore"][0]
+            if score == "NBS":
+                subscores = np.where(self.optional & np.isnan(subscores), 0, subscores)
+            better = ranks[np.newaxis, :] < ranks[:, np.newaxis]
+
+            for index, metric in enumerate(self.metrics):
+                weight = weights[index]
+                if weight == 0:
+                    continue
+                # Loss of each algorithm without the metric
+                rest = loss - sign * weight * subscores[:, index]
+
+                if score == "NBS" and metric.normalization != "best":
+                    # Linear in the subscore, solved for y = -subscore
+                    column = ("Avg. Normalized " if metric.normalization == "column" else "Avg. ") + metric.name
+                    current = normalized[:, index]
+                    reverse = np.negative
+                    thresholds = (loss[np.newaxis, :] - rest[:, np.newaxis]) / weight
+                else:
+                    # Lower is better in y, higher is better metrics are solved for their reciprocal
+                    column = "Avg. " + metric.name
+                    current = values[:, index]
+                    reverse = (lambda y: y) if metric.lowerIsBetter else np.reciprocal
+                    with np.errstate(divide="ignore"):
+                        y = reverse(current.astype(float))
+                    if score == "SRBS":
+                        thresholds = self.solveRankThresholds(y, rest, weight)
+                    else:
+                        thresholds = self.solveRatioThresholds(score, y, rest, weight)
+
+                rows, columns = np.nonzero(better)
+                with np.errstate(divide="ignore"):
+                    target = reverse(thresholds[rows, columns])
+                tables.append(pd.DataFrame({
+                    "Score": score,
+                    "Algorithm": algorithms[rows],
+                    "Rank": ranks[rows],
+                    "Metric": metric.name,
+                    "Column": column,
+                    "Current Value": current[rows],
+                    "Target": algorithms[columns],
+                    "Target Rank": ranks[columns],
+                    "Value": target,
+                    "Change": target - current[rows]
+                }))
+        return pd.concat(tables, ignore_index=True)
+
+    def getNextRankChanges(self, whatIf):
+        ''' Reduces the pairs of calculate_WhatIf to the smallest change of each score, algorithm and metric, i.e. the
+        change that ties the closest algorithm ranked above. '''
+        reachable = whatIf.dropna(subset=["Change"])
+        closest = reachable["Change"].abs().groupby(
+            [reachable["Score"], reachable["Algorithm"], reachable["Metric"]], sort=False).idxmin()
+        return reachable.loc[closest.values].reset_index(drop=True)
+
+    def solveRatioThresholds(self, score, y, rest, weight):
+        ''' Returns the A x A values of y (lower is better) at which the row algorithm ties the column algorithm under
+        the WRBS, IWRBS or a NBS normalized by the best average. The anchor of the ratios (the best or worst y) either
+        stays with the other algorithms or moves to the row algorithm, both regimes are solved and the valid solution
+        closest to the current y is returned. '''
+        others = np.where(np.eye(len(y), dtype=bool), np.nan, y[np.newaxis, :])
+        current = y[:, np.newaxis]
+        rowRest, columnRest, columnY = rest[:, np.newaxis], rest[np.newaxis, :], y[np.newaxis, :]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if score == "WRBS":
+                # weight * y / min(y)
+                anchor = np.fmin.reduce(others, axis=1, initial=np.nan)[:, np.newaxis]
+                kept = (columnRest - rowRest) * anchor / weight + columnY
+                kept = np.where(kept >= anchor, kept, np.nan)
+                moved = weight * columnY / (rowRest + weight - columnRest)
+                moved = np.where((moved > 0) & (moved < anchor), moved, np.nan)
+            else:
+                # -weight * max(y) / y (IWRBS) or -weight * min(y) / y (NBS)
+                if score == "IWRBS":
+                    anchor = np.fmax.reduce(others, axis=1, initial=np.nan)[:, np.newaxis]
+                else:
+                    anchor = np.fmin.reduce(others, axis=1, initial=np.nan)[:, np.newaxis]
+                kept = weight * anchor / (rowRest - columnRest + weight * anchor / columnY)
+                moved = columnY * (columnRest - rowRest + weight) / weight
+                if score == "IWRBS":
+                    kept = np.where((kept > 0) & (kept <= anchor), kept, np.nan)
+                    moved = np.where(moved > anchor, moved, np.nan)
+                else:
+                    kept = np.where(kept >= anchor, kept, np.nan)
+                    moved = np.where((moved > 0) & (moved < anchor), moved, np.nan)
+
+            # Improvements lower y, take the valid solution closest to the current value
+            kept = np.where(kept <= current, kept, np.nan)
+            moved = np.where(moved <= current, moved, np.nan)
+            return np.fmax(kept, moved)
+
+    def solveRankThresholds(self, y, rest, weight):
+        ''' Returns the A x A values of y (lower is better) at which the row algorithm ties the column algorithm under
+        the SRBS. The subscores only change where y meets or passes the value of another algorithm, so these
+        breakpoints are evaluated at once and the one closest to the current y is returned. '''
+        algorithms = len(y)
+        candidates = np.concatenate([y, np.nextafter(y, -np.inf)])
+
+        # A x C x A values with the y of the row algorithm replaced by each candidate
+        replaced = np.broadcast_to(y, (algorithms, len(candidates), algorithms)).copy()
+        replaced[np.arange(algorithms), :, np.arange(algorithms)] = candidates
+        losses = rest + weight * denseRank(replaced)
+        own = losses[np.arange(algorithms), :, np.arange(algorithms)]
+
+        with np.errstate(invalid="ignore"):
+            reached = (own[:, :, np.newaxis] <= losses) & \
+                (candidates[np.newaxis, :] <= y[:, np.newaxis])[:, :, np.newaxis]
+        thresholds = np.where(reached, candidates[np.newaxis, :, np.newaxis], -np.inf).max(axis=1)
+        return np.where(np.isneginf(thresholds), np.nan, thresholds)
+
+    def getBootstrapReplicates(self, replicates=1000, minimum=100, budget=10000000):
+        ''' Returns the default number of bootstrap replicates, reduced so that all replicates draw at most budget
+        rows (about 0.2 s of resampling) and 0 if fewer than minimum replicates remain. '''
+        replicates = min(replicates, budget // max(len(self.data), 1))
+        return replicates if replicates >= minimum else 0
+
+    def calculate_Bootstrap(self, prioritization, replicates=1000, confidence=0.95, seed=None, chunkSize=10000000):
+        ''' Resamples the rows of each algorithm with replacement, scores every replicate of the averages and reports
+        the percentile confidence interval of each score and the probability of each rank. Only the averaged columns
+        of the weighted metrics are resampled, the others keep their average as they do not change the scores.
+        Replicates are drawn in vectorized chunks of about chunkSize drawn rows, each replicate counts how often it
+        drew every row of an algorithm and averages them with one matrix product. '''
+        averages = self.getAlgorithmAverages()
+        algorithms = len(averages)
+        codes = averages.index.get_indexer(self.data['Algorithm'].astype(object))
+        weights = [prioritization.getWeights(self.metrics)]
+        weighted = [index for index, weight in enumerate(weights[0]) if weight != 0]
+        columns = sorted(set(self.getAverageIndices(
+            [self.criteriaAveraged[index] for index in weighted] + [self.criteriaNormalized[index] for index in weighted])))
+
+        # Rows sorted by algorithm, every resampled row stays within the segment of its algorithm
+        order = np.argsort(codes, kind="stable")
+        sizes = np.bincount(codes, minlength=algorithms)
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        values = self.getSamplingValues(self.data).values[order][:, columns]
+        valid = ~np.isnan(values)
+        values = np.where(valid, values, 0)
+        valid = valid.astype(float)
+        rowCount = len(values)
+
+        rng = np.random.default_rng(seed)
+        scoreNames = ["NBS", "SRBS", "WRBS", "IWRBS"]
+        samples = {score: [] for score in scoreNames}
+        ranks = {score: [] for score in scoreNames}
+        step = max(1, chunkSize // max(rowCount, 1))
+        for start in range(0, replicates, step):
+            count = min(step, replicates - start)
+
+            # R x A x C averages of the replicates
+            replicate = np.repeat(averages.values[np.newaxis].astype(float), count, axis=0)
+            for algorithm in np.flatnonzero(sizes):
+                size = sizes[algorithm]
+                segment = slice(starts[algorithm], starts[algorithm] + size)
+                rows = rng.integers(0, size, size=(count, size)) + np.arange(count)[:, np.newaxis] * size
+                drawn = np.bincount(rows.ravel(), minlength=count * size).reshape(count, size).astype(float)
+                sums = drawn @ values[segment]
+                counts = drawn @ valid[segment]
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    replicate[:, algorithm, columns] = sums / np.where(counts > 0, counts, np.nan)
+
+            scores = self.scoreAverages(weights, replicate)
+            for score in scoreNames:
+                samples[score].append(scores[score][:, 0, :])
+                ranks[score].append(scores[score + " Rank"][:, 0, :])
+
+        # Percentile intervals and rank probabilities over all replicates
+        point = self.scoreAverages(weights, averages.values)
+        tail = (1 - confidence) / 2 * 100
+        tables = []
+        for score in scoreNames:
+            scoreSamples = np.concatenate(samples[score])
+            scoreRanks = np.concatenate(ranks[score])
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                low, high = np.nanpercentile(
+                    scoreSamples, [tail, 100 - tail], axis=0)
+            table = pd.DataFrame({"Score": score,
+                                  "Algorithm": averages.index.values,
+                                  "Value": point[score][0],
+                                  "CI Low": low,
+                                  "CI High": high,
+                                  "Rank": point[score + " Rank"][0]})
+            probabilities = (scoreRanks[:, :, np.newaxis] ==
+                             np.arange(1, algorithms + 1)).mean(axis=0)
+            for rank in range(algorithms):
+                table["P(Rank " + str(rank + 1) + ")"] = probabilities[:, rank]
+            tables.append(table)
+        return pd.concat(tables, ignore_index=True)
+
+    def calculate_Evolution(self, prioritization):
+        ''' Scores the snapshots of each product line in chronological order, every snapshot on its own and
+        incrementally on all snapshots up to it. The product line and date are parsed from the system name. Returns
+        the scores with the drift of the rank to the previous snapshot (positive if the algorithm fell behind) and a
+        summary of the drift of each product line and algorithm, or None for both without any dated snapshot. '''
+        names = self.data['System Name'].astype(object)
+        dated = names.str.extract(self.snapshotPattern)[1].notna()
+        if (~dated).any():
+            print("Skipped " + str(names[~dated].nunique()) +
+                  " systems without a snapshot date in their name")
+        if not dated.any():
+            return None, None
+        keys, algorithms, sums, counts, rows = self.computeGroupSums(
+            names.where(dated))
+
+        # Sort the snapshots by product line and date
+        snapshots = pd.Series(keys, dtype=object).str.extract(self.snapshotPattern)
+        snapshots["System Name"] = keys
+        snapshots = snapshots.sort_values([0, 1, "System Name"], kind="stable")
+        order = snapshots.index.values
+        lines, dates = snapshots[0].values, snapshots[1].values
+        sums, counts, rows = sums[order], counts[order], rows[order]
+
+        # Running sums within each product line
+        lineStart = np.r_[True, lines[1:] != lines[:-1]]
+        segment = np.cumsum(lineStart) - 1
+        cumulative = [np.cumsum(values, axis=0) for values in (sums, counts, rows)]
+        sumsUpTo, countsUpTo, rowsUpTo = [total - (total - values)[lineStart][segment]
+                                          for total, values in zip(cumulative, (sums, counts, rows))]
+
+        # Score the single and the cumulative snapshots in one pass, 2 x G x 1 x A
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = np.stack([sums / np.where(counts > 0, counts, np.nan),
+                                 sumsUpTo / np.where(countsUpTo > 0, countsUpTo, np.nan)])
+        scores = self.scoreAverages(
+            [prioritization.getWeights(self.metrics)], averages)
+        present = np.stack([rows > 0, rowsUpTo > 0])
+
+        block = {
+            "Product Line": np.repeat(lines, len(algorithms)),
+            "Date": np.repeat(dates, len(algorithms)),
+            "System Name": np.repeat(snapshots["System Name"].values, len(algorithms)),
+            "Algorithm": np.tile(algorithms, len(order))
+        }
+        tables = []
+        for score in ["NBS", "SRBS", "WRBS", "IWRBS"]:
+            ranks = np.where(present, scores[score + " Rank"][:, :, 0, :], np.nan)
+            drift = np.concatenate(
+                [np.full(ranks[:, :1].shape, np.nan), ranks[:, 1:] - ranks[:, :-1]], axis=1)
+            drift[:, lineStart] = np.nan
+
+            table = pd.DataFrame(block)
+            table["Score"] = score
+            table["Value"] = scores[score][0, :, 0, :].ravel()
+            table["Rank"] = ranks[0].ravel()
+            table["Rank Drift"] = drift[0].ravel()
+            table["Cumulative Value"] = scores[score][1, :, 0, :].ravel()
+            table["Cumulative Rank"] = ranks[1].ravel()
+            table["Cumulative Rank Drift"] = drift[1].ravel()
+            tables.append(table[present[0].ravel()])
+        evolution = pd.concat(tables, ignore_index=True)
+
+        # Drift of the ranks over the snapshots of each product line
+        grouped = evolution.groupby(
+            ["Product Line", "Score", "Algorithm"], sort=False)
+        summary = grouped.agg(**{
+            "Snapshots": ("Rank", "size"),
+            "First Date": ("Date", "first"),
+            "Last Date": ("Date", "last"),
+            "First Rank": ("Rank", "first"),
+            "Last Rank": ("Rank", "last"),
+            "Best Rank": ("Rank", "min"),
+            "Worst Rank": ("Rank", "max"),
+            "Rank Changes": ("Rank Drift", lambda drift: int((drift.fillna(0) != 0).sum())),
+            "Mean Absolute Drift": ("Rank Drift", lambda drift: drift.abs().mean()),
+            "Final Cumulative Rank": ("Cumulative Rank", "last")
+        }).reset_index()
+        return evolution, summary
+
+    def computeGroupAverages(self, groups):
+        ''' Averages the sampling data of each pair of group key and algorithm. Returns the group keys in the order
+        of their first appearance, the algorithms, a G x A x 8 array of the averaged columns and a G x A mask that is
+        False where a group has no results of an algorithm. '''
+        keys, algorithms, sums, counts, rows = self.computeGroupSums(groups)
+        if self.aggregate == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                averages = sums / np.where(counts > 0, counts, np.nan)
+        else:
+            _, _, bins, keyed = self.getGroupBins(groups)
+            values = self.getSamplingValues(self.data)[keyed]
+            averages = self.aggregateGroups(values, bins)
+            averages = averages.reindex(range(rows.size)).values.reshape(
+                rows.shape + (-1,))
+        return keys, algorithms, averages, rows > 0
+
+    def computeGroupSums(self, groups):
+        ''' Sums and counts the valid values of the sampling data of each pair of group key and algorithm in one
+        binned pass. Rows with a missing group key are skipped and negative sentinels are ignored. Returns the group
+        keys in the order of their first appearance, the algorithms, the G x A x 8 sums and counts and the G x A
+        number of rows. '''
+        keys, algorithms, bins, keyed = self.getGroupBins(groups)
+        values = self.getSamplingValues(self.data).values[keyed]
+        valid = ~np.isnan(values)
+
+        # One bin per group and algorithm, the algorithms keep the order of the overall averages
+        size = len(keys) * len(algorithms)
+        sums = np.stack([np.bincount(bins, weights=np.where(valid[:, column], values[:, column], 0), minlength=size)
+                         for column in range(values.shape[1])], axis=-1)
+        counts = np.stack([np.bincount(bins, weights=valid[:, column], minlength=size)
+                           for column in range(values.shape[1])], axis=-1)
+        rows = np.bincount(bins, minlength=size)
+        shape = (len(keys), len(algorithms))
+        return keys, algorithms, sums.reshape(shape + (-1,)), counts.reshape(shape + (-1,)), rows.reshape(shape)
+
+    def getGroupBins(self, groups):
+        ''' Returns the group keys in the order of their first appearance, the algorithms, the bin (group x algorithm)
+        of each row with a group key and the mask of these rows. '''
+        keyCodes, keys = pd.factorize(np.asarray(groups, dtype=object))
+        algorithms = self.getAlgorithmAverages().index
+        bins = keyCodes * len(algorithms) + \
+            algorithms.get_indexer(self.data['Algorithm'].astype(object))
+        return keys, algorithms.values, bins[keyCodes >= 0], keyCodes >= 0
+
+    def getSamplingValues(self, entries):
+        ''' Returns the columns of the given entries that are averaged as floats. Values below the missingBelow bound
+        of their metric (by default negative sentinels) are missing. With a penalty k, runs that timed out or failed count as PAR-k runs: their time is k times the timeout, their
+        normalized time 1 - k, they cover nothing, produce no sample and get the worst normalized size and memory. '''
+        values = entries[list(self.averageMapping.values())].astype(float)
+        bounds = {}
+        for metric in self.metrics:
+            bound = -np.inf if metric.missingBelow is None else metric.missingBelow
+            bounds[metric.column] = bound
+            if metric.normalizedColumn is not None:
+                bounds[metric.normalizedColumn] = bound
+        values = values.where(values.ge(pd.Series(bounds), axis=1))
+        if self.penalty is not None:
+            failed = ~(entries['In Time'].astype(bool) & entries['No Error'].astype(bool))
+            values.loc[failed, 'Sample Time'] = self.penalty * \
+                entries.loc[failed, 'System Timeout'].astype(float)
+            values.loc[failed, 'Nom. Sample Time'] = 1 - self.penalty
+            values.loc[failed, 'Sample Coverage'] = 0
+            values.loc[failed, 'Sample Size'] = np.nan
+            values.loc[failed, 'Nom. Sample Size'] = 0
+            values.loc[failed, 'Nom. Sample Memory'] = 0
+        return values
+
+    def aggregateGroups(self, values, groups):
+        ''' Aggregates the columns of the given values per group with the aggregator of the frame. Missing values
+        are skipped. The trimmed mean drops the lowest and highest trimmedShare of each group and column, the
+        geometric mean is zero if a group contains a zero and is not defined for negative values (e.g. the penalized
+        normalized time of PAR-k). '''
+        grouped = values.groupby(groups, sort=False, observed=True)
+        if self.aggregate == "median":
+            return grouped.median()
+        elif self.aggregate == "trimmed":
+            # Position of each value within its sorted group and column
+            positions = grouped.rank(method="first")
+            counts = grouped.transform("count")
+            cut = np.floor(counts * self.trimmedShare)
+            kept = values.where((positions > cut) & (positions <= counts - cut))
+            return kept.groupby(groups, sort=False, observed=True).mean()
+        elif self.aggregate == "geometric":
+            with np.errstate(divide="ignore"):
+                logarithms = np.log(values)
+            return np.exp(logarithms.groupby(groups, sort=False, observed=True).mean())
+        return grouped.mean()
+
+    def getAverageIndices(self, columns):
+        ''' Returns the positions of the given averaged columns in the averageMapping. '''
+        keys = list(self.averageMapping.keys())
+        return [keys.index(column) for column in columns]
+
+    def getAlgorithmAverages(self):
+        ''' Returns the averages of each algorithm. They are computed once per loaded data and reused for all prioritizations. '''
+        if self.averagesCache is None:
+            self.averagesCache = self.computeAverages()
+        return self.averagesCache
+
+    def computeAverages(self, data=None):
+        ''' Aggregates the sampling data (default: the loaded rows) of each algorithm in one grouped pass. Negative
+        values are sentinels for missing measurements and are ignored. Returns a frame indexed by the algorithm. '''
+        if data is None:
+            data = self.data
+        values = self.getSamplingValues(data)
+        averages = self.aggregateGroups(values, data['Algorithm'])
+        averages.index = averages.index.astype(object)
+        averages.columns = list(self.averageMapping.keys())
+        return averages
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+    #
+    # Data Handling (Saving, Loading, Importing)
+    #
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def load(self, absoluteInputPath, jobs=1, absoluteCachePath=None):
+        ''' Reads the sampling data from the all files in the given input path. The files of a directory are
+        parsed by the given number of processes (0 = all cores) and merged in the order of their paths. If a cache
+        path is given, only files that changed since the last load are parsed again. '''
+        # 1. Empty current data
+        self.data = self.data.iloc[0:0]
+        self.averagesCache = None
+
+        self.accumulator = None
+        self.ingestedFiles = {}
+
+        paths = self.getInputPaths(absoluteInputPath)
+        if absoluteCachePath:
+            # Reuse the entries of unchanged files and parse only the changed ones
+            cache = SamplingCache(absoluteCachePath,
+                                  json.dumps(self.headerTypes))
+            fileEntries = [cache.get(path) for path in paths]
+            changedPaths = [path for path, entries in zip(paths, fileEntries)
+                            if entries is None]
+            changedEntries = dict(
+                zip(changedPaths, self.readFiles(changedPaths, jobs)))
+            for path, entries in changedEntries.items():
+                if entries is not None:
+                    cache.put(path, entries)
+            cache.save()
+            fileEntries = [changedEntries[path] if entries is None else entries
+                           for path, entries in zip(paths, fileEntries)]
+        else:
+            fileEntries = self.readFiles(paths, jobs)
+
+        # Merge all valid files at once
+        fileEntries = [entries for entries in fileEntries if entries is not None]
+        if len(fileEntries) > 0:
+            self.data = self.concatEntries(fileEntries)
+
+    def getInputPaths(self, absoluteInputPath):
+        ''' Returns the csv files of the given input path sorted by their path. '''
+        if os.path.isdir(str(absoluteInputPath)):
+            # Read all files and process the "input*.csv files"
+            return sorted(glob(os.path.join(absoluteInputPath, "*.csv")))
+        elif os.path.isfile(str(absoluteInputPath)):
+            return [absoluteInputPath]
+        return []
+
+    def readFiles(self, paths, jobs=1):
+        ''' Reads the given files with the given number of processes (0 = all cores). Returns the entries in the order of the paths. '''
+        if jobs != 1 and len(paths) > 1:
+            # Parse the files in a process pool, map keeps the order of the paths
+            workers = None if jobs <= 0 else min(jobs, len(paths))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(readSamplingFile, paths))
+        return [self.readFile(path) for path in paths]
+
+    def readAlgorithms(self, paths, jobs=1):
+        ''' Reads the algorithm of each given submission with the given number of processes (0 = all cores). '''
+        if jobs != 1 and len(paths) > 1:
+            workers = None if jobs <= 0 else min(jobs, len(paths))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(readSubmissionAlgorithm, paths))
+        return [self.readAlgorithm(path) for path in paths]
+
+    def concatEntries(self, fileEntries):
+        ''' Concatenates the given entries and restores the categorical columns whose categories differ between them. '''
+        entries = pd.concat(fileEntries, ignore_index=True)
+        return entries.astype({column: columnType for column, columnType in self.headerTypes.items()
+                               if columnType == "category"})
+
+    def loadIncremental(self, absoluteInputPath):
+        ''' Reads only the rows that were added to the files of the given input path since the last call and
+        updates the averages with their delta. The first call reads all files. Like in the streaming mode the rows are
+        not kept, only the averages and scores are available afterwards. Returns the number of new rows. '''
+        if self.accumulator is None:
+            # Start from scratch
+            self.data = self.data.iloc[0:0]
+            self.ingestedFiles = {}
+            self.accumulator = AverageAccumulator(
+                self.averageMapping, self.getSamplingValues)
+
+        # Read the new rows of all files
+        fileEntries = [self.readNewRows(path)
+                       for path in self.getInputPaths(absoluteInputPath)]
+        fileEntries = [entries for entries in fileEntries
+                       if entries is not None and len(entries) > 0]
+        if len(fileEntries) == 0:
+            return 0
+
+        # Update the averages with the new rows only
+        entries = self.concatEntries(fileEntries)
+        self.accumulator.add(entries)
+        self.averagesCache = self.accumulator.getAverages()
+        return len(entries)
+
+    def loadStreaming(self, absoluteInputPath, chunkSize=100000):
+        ''' Folds the files of the given input path chunk by chunk into running sums and counts without keeping
+        the rows, so the memory does not grow with the input. Only the averages and scores are available afterwards. '''
+        self.data = self.data.iloc[0:0]
+        self.ingestedFiles = {}
+        self.accumulator = AverageAccumulator(
+            self.averageMapping, self.getSamplingValues)
+
+        for path in self.getInputPaths(absoluteInputPath):
+            for fileData in pd.read_csv(path, sep=";", chunksize=chunkSize):
+                entries = self.convertFileData(fileData, path)
+                if entries is None:
+                    break
+                self.accumulator.add(entries)
+        self.averagesCache = self.accumulator.getAverages()
+
+    def readNewRows(self, absoluteFilePath):
+        ''' Reads the complete rows that were appended to the given file since it was read last. The read offset only
+        advances once the rows are converted. Files that do not match the expected schema or were truncated are
+        reported once and skipped afterwards. '''
+        path = os.path.abspath(str(absoluteFilePath))
+        state = self.ingestedFiles.get(path)
+        if state is not None and state.get("rejected"):
+            return None
+
+        with open(path, 'rb') as file:
+            if state is None:
+                # New file, read its header first (with or without byte order mark)
+                header = file.readline()
+                if not header.endswith(b"\n"):
+                    return None
+                state = {"offset": len(header),
+                         "columns": header.decode("utf-8-sig").strip().split(";")}
+                if not self.checkColumns(state["columns"], path):
+                    self.ingestedFiles[path] = {"rejected": True}
+                    return None
+            elif os.path.getsize(path) < state["offset"]:
+                print("Skipped " + path + ", the file was truncated")
+                self.ingestedFiles[path] = {"rejected": True}
+                return None
+
+            # Only consume complete lines, a partially written row is read with the next call
+            file.seek(state["offset"])
+            content = file.read()
+            end = content.rfind(b"\n") + 1
+
+        entries = None
+        if end > 0:
+            fileData = pd.read_csv(io.BytesIO(content[:end]), sep=";",
+                                   header=None, names=state["columns"])
+            entries = self.convertFileData(fileData, path)
+        self.ingestedFiles[path] = {"offset": state["offset"] + end,
+                                    "columns": state["columns"]}
+        return entries
+
+    def readFile(self, absoluteFilePath):
+        ''' Reads the given file and returns its converted entries or None if the file does not match the expected schema. '''
+        # Read file
+        fileData = pd.read_csv(absoluteFilePath, sep=";")
+        return self.convertFileData(fileData, absoluteFilePath)
+
+    def readAlgorithm(self, absoluteFilePath):
+        ''' Returns the first algorithm of the given file or None if the file does not match the expected schema or
+        has no rows. Only the algorithm column is parsed. '''
+        header = pd.read_csv(absoluteFilePath, sep=";", nrows=0)
+        if not self.checkColumns(header.columns, absoluteFilePath):
+            return None
+        algorithms = pd.read_csv(absoluteFilePath, sep=";", usecols=[
+                                 self.headerMapping["Algorithm"]]).iloc[:, 0].dropna()
+        return algorithms.iloc[0] if len(algorithms) > 0 else None
+
+    def convertFileData(self, fileData, absoluteFilePath):
+        ''' Checks the raw data of the given file against the expected schema and returns the converted entries or None. '''
+        if not self.checkColumns(fileData.columns, absoluteFilePath):
+            return None
+
+        return self.convertRawData(fileData)
+
+    def checkColumns(self, columns, absoluteFilePath):
+        ''' Returns whether the given raw columns contain the expected schema and reports the missing ones otherwise. '''
+        missingColumns = [column for column in self.rawHeader
+                          if column not in columns]
+        if len(missingColumns) > 0:
+            print("Skipped " + str(absoluteFilePath) +
+                  ", missing columns: " + ", ".join(missingColumns))
+            return False
+        return True
+
+    def convertRawData(self, fileData):
+        ''' Maps the columns of a raw result file onto the typed header of the sampling frame. '''
+        # Skip empty lines
+        fileData = fileData[fileData['AlgorithmID'].notna()]
+
+        # Rename the raw columns
+        entries = pd.DataFrame(
+            {column: fileData[rawColumn] for column, rawColumn in self.headerMapping.items()})
+
+        # Compute the normalized columns
+        entries['Nom. Sample Size'] = 1 - \
+            (fileData['Size'] / fileData['Valid Conditions'])
+        entries['Nom. Sample Time'] = 1 - \
+            (fileData['Time'] / fileData['Timeout'])
+        entries['Nom. Sample Memory'] = 1 - \
+            (fileData['TotalCreatedBytes'] / fileData['Valid Conditions'])
+        entries['Nom. Sample Memory'] = entries['Nom. Sample Memory'].clip(
+            lower=0)
+
+        # Completion status
+        entries['In Time'] = fileData['InTime'].astype(str).str.lower() == "true"
+        entries['No Error'] = fileData['NoError'].astype(
+            str).str.lower() == "true"
+        return self.applyTypes(entries[self.header])
+
+    def applyTypes(self, entries):
+        ''' Converts the entries to the types of the header. Integer columns with missing values are stored as float64. '''
+        types = {}
+        for column, columnType in self.headerTypes.items():
+            if columnType.startswith("int") and entries[column].isna().any():
+                columnType = "float64"
+            types[column] = columnType
+        return entries.astype(types)
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# SamplingCache
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SamplingCache:
+    ''' Persistent cache of converted result files. Each entry is keyed by the path, size and modification time of its
+    source file and by the schema of the converted entries. '''
+    indexName = "index.json"
+
+    def __init__(self, absoluteCachePath, schema=""):
+        self.path = absoluteCachePath
+        self.schema = hashlib.sha1(schema.encode("utf-8")).hexdigest()
+        self.index = {}
+        Path(self.path).mkdir(parents=True, exist_ok=True)
+
+        indexPath = os.path.join(self.path, self.indexName)
+        if os.path.isfile(indexPath):
+            with open(indexPath, 'r') as file:
+                self.index = json.load(file)
+
+    def getKey(self, absoluteFilePath):
+        ''' Returns the absolute path, size and modification time of the given file. '''
+        stat = os.stat(str(absoluteFilePath))
+        return os.path.abspath(str(absoluteFilePath)), stat.st_size, stat.st_mtime_ns
+
+    def get(self, absoluteFilePath):
+        ''' Returns the cached entries of the given file or None if the file is unknown or changed. '''
+        path, size, mtime = self.getKey(absoluteFilePath)
+        entry = self.index.get(path)
+        if entry is None or entry["size"] != size or entry["mtime"] != mtime or entry.get("schema") != self.schema:
+            return None
+
+        cachedFilePath = os.path.join(self.path, entry["file"])
+        if not os.path.isfile(cachedFilePath):
+            return None
+        return pd.read_pickle(cachedFilePath)
+
+    def put(self, absoluteFilePath, entries):
+        ''' Stores the converted entries of the given file. '''
+        path, size, mtime = self.getKey(absoluteFilePath)
+        fileName = hashlib.sha1(path.encode("utf-8")).hexdigest() + ".pkl"
+        entries.to_pickle(os.path.join(self.path, fileName))
+        self.index[path] = {"size": size, "mtime": mtime,
+                            "schema": self.schema, "file": fileName}
+
+    def save(self):
+        ''' Writes the index of the cache to disk. '''
+        with open(os.path.join(self.path, self.indexName), 'w+') as file:
+            json.dump(self.index, file, indent=2)
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# AverageAccumulator
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class AverageAccumulator:
+    ''' Running sums and counts of the averaged columns of each algorithm. getValues returns the averaged columns of
+    the entries with missing values for the ignored ones (SamplingFrame.getSamplingValues). '''
+
+    def __init__(self, averageMapping, getValues):
+        self.averageMapping = averageMapping
+        self.getValues = getValues
+        self.sums = None
+        self.counts = None
+
+    def add(self, entries):
+        ''' Adds the given sampling entries to the sums and counts. '''
+        values = self.getValues(entries)
+        grouped = values.groupby(
+            entries['Algorithm'], sort=False, observed=True)
+        sums = grouped.sum()
+        counts = grouped.count()
+        sums.index = sums.index.astype(object)
+        counts.index = counts.index.astype(object)
+
+        if self.sums is None:
+            self.sums = sums
+            self.counts = counts
+        else:
+            # Keep the order in which the algorithms appeared
+            index = self.sums.index.append(
+                sums.index.difference(self.sums.index, sort=False))
+            self.sums = self.sums.reindex(index, fill_value=0) + \
+                sums.reindex(index, fill_value=0)
+            self.counts = self.counts.reindex(index, fill_value=0) + \
+                counts.reindex(index, fill_value=0)
+
+    def getAverages(self):
+        ''' Returns the averages of each algorithm like SamplingFrame.computeAverages. '''
+        if self.sums is None:
+            return pd.DataFrame(columns=list(self.averageMapping.keys()), dtype=float)
+        averages = self.sums / self.counts.where(self.counts > 0)
+        averages.columns = list(self.averageMapping.keys())
+        return averages
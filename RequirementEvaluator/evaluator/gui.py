@@ -0,0 +1,1237 @@
+# Graphical interface of the requirements evaluator, only imported by the gui mode.
+import os
+# For opening respective folders
+import subprocess
+# For timestamping files
+from datetime import datetime
+from pathlib import Path
+# Tkinter + Plotting
+from tkinter import *
+from tkinter import filedialog
+from tkinter.ttk import *
+import matplotlib.cm as cmx
+import matplotlib as mpl
+import matplotlib.colors as colors
+import matplotlib.pyplot as plt
+import matplotlib.transforms as transforms
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from .core import Prioritization, SamplingFrame, getMetrics, getPrioritization
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# GUI
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RequirementEvaluator:
+    ''' The graphical class of our requirements evaluator. '''
+    # plot markers
+    markers = ("+", "+", "+", "+", "+", "+")
+    # UI Variables
+    master = None
+    frame = Frame
+    menubar = Menu
+    labelDataStatusValue, labelDataEntriesValue, labelDataAlgorithmsValue = Label, Label, Label
+    listEvalList = Listbox
+    labelPlotName = Text
+    plotFrame = Frame
+    grayscaleMode, logarithmicMode, gridMode, avaragesMode, hideLegend = IntVar, IntVar, IntVar, IntVar, IntVar
+    varWidth, varHeight, varDPI, varLeft, varTop, varBottom, varRight, varXSpace, varYSpace = DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar
+    overrideWidthHeight, overrideLeftRight, overrideTopBottom, overrideSpace = IntVar, IntVar, IntVar, IntVar
+    # Data Variables
+    samplingFrame = SamplingFrame
+    args = None
+    samplePrioitization = Prioritization
+    sizeSteps = DoubleVar
+    sizeVar, timeVar, coverageVar, similarityVar, memoryVar = DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar
+    sizeVarEnd, timeVarEnd, coverageVarEnd, similarityVarEnd, memoryVarEnd = DoubleVar, DoubleVar, DoubleVar, DoubleVar, DoubleVar
+    plotListEntries = []  # List containing the different prioritizations to plot
+
+    def plot_addToList(self):
+        ''' Adds the current priority to the plotting list it it is not already available.  '''
+        copy = self.samplePrioitization.copy()
+
+        # Check if the same is already available
+        alreadyInList = False
+        for prio in self.plotListEntries:
+            alreadyInList = copy.identical(prio)
+
+        if not alreadyInList:
+            self.plotListEntries.append(copy)
+            self.listEvalList.insert(END, copy)
+
+    def plot_clearList(self):
+        ''' Removes all entries of the plotting list. '''
+        self.listEvalList.delete(0, END)
+        self.plotListEntries.clear()
+
+    def plot_calculateScoreForList(self):
+        ''' Computes all scores for all prioritizations '''
+
+    def plot_plotList(self):
+        ''' Plots all lists. '''
+        # Remove all old plots
+        self.plot_removePlots()
+
+        # Check if data is available
+        if self.samplingFrame.data is None or len(self.samplingFrame.data) == 0:
+            # Case: No data available inform user
+            Label(self.plotFrame, text="No data loaded to plot!").pack()
+        else:
+            # Compute
+            boxPlot = False
+            if len(self.plotListEntries) == 0:
+                self.samplingFrame.computeScores(
+                    os.path.join(self.args.output, "scores"), [self.samplePrioitization])
+                boxPlot = True
+            elif len(self.plotListEntries) == 1:
+                self.samplingFrame.computeScores(
+                    os.path.join(self.args.output, "scores"), self.plotListEntries)
+                boxPlot = True
+            else:
+                self.samplingFrame.computeScores(
+                    os.path.join(self.args.output, "scores"), self.plotListEntries)
+
+            jet = plt.get_cmap('Dark2')
+            if self.isGrayscale():
+                jet = plt.get_cmap('gray')
+
+            cNorm = colors.Normalize(vmin=0, vmax=6)
+            scalarMap = cmx.ScalarMappable(norm=cNorm, cmap=jet)
+            scalarMap.get_clim()
+
+            # Boxplot when only one priority
+            figure1 = None
+            if boxPlot:
+                # Create Boxplots
+                if(self.overrideWidthHeight.get() == 1):
+                    figure1 = plt.Figure(
+                        figsize=(int(self.varWidth.get()), int(self.varHeight.get())), dpi=int(self.varDPI.get()))
+                else:
+                    self.varWidth.set(20)
+                    self.varHeight.set(5)
+                    self.varDPI.set(100)
+                    figure1 = plt.Figure(figsize=(20, 5), dpi=100)
+                self.plot_createBarPlot("NBS (highest-best)", figure1, 141, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'NBS', scalarMap)
+                self.plot_createBarPlot("SRBS (lowest-best)", figure1, 142, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'SRBS', scalarMap)
+                self.plot_createBarPlot("WRBS (lowest-best)", figure1, 143, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'WRBS', scalarMap)
+                self.plot_createBarPlot("IWRBS (highest-best)", figure1, 144, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'IWRBS', scalarMap)
+
+                bar = FigureCanvasTkAgg(figure1, self.plotFrame)
+                bar.draw()
+                bar.get_tk_widget().pack()
+            else:
+                # Create scatter
+                if(self.overrideWidthHeight.get() == 1):
+                    figure1 = plt.Figure(
+                        figsize=(int(self.varWidth.get()), int(self.varHeight.get())), dpi=int(self.varDPI.get()))
+                else:
+                    self.varWidth.set(20)
+                    self.varHeight.set(6)
+                    self.varDPI.set(100)
+                    figure1 = plt.Figure(figsize=(20, 6), dpi=100)
+                self.plot_createPlot("NBS (highest-best)", figure1, 141, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'NBS', scalarMap)
+                self.plot_createPlot("SRBS (lowest-best)", figure1, 142, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'SRBS', scalarMap)
+                self.plot_createPlot("WRBS (lowest-best)", figure1, 143, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'WRBS', scalarMap)
+                self.plot_createPlot("IWRBS (highest-best)", figure1, 144, self.samplingFrame.getAverageData(
+                ), 'Algorithm', 'Prioritization', 'IWRBS', scalarMap)
+
+                figure1.autofmt_xdate(rotation=70)
+
+                if(self.overrideLeftRight.get() == 1):
+                    figure1.subplots_adjust(left=float(
+                        self.varLeft.get()), right=float(self.varRight.get()))
+                else:
+                    self.varLeft.set(0.15)
+                    self.varRight.set(0.99)
+                    figure1.subplots_adjust(left=float(
+                        self.varLeft.get()), right=float(self.varRight.get()))
+
+                if(self.overrideTopBottom.get() == 1):
+                    figure1.subplots_adjust(top=float(
+                        self.varTop.get()), bottom=float(self.varBottom.get()))
+                else:
+                    self.varTop.set(0.9)
+                    self.varBottom.set(0.25)
+                    figure1.subplots_adjust(top=float(
+                        self.varTop.get()), bottom=float(self.varBottom.get()))
+
+                if(self.overrideSpace.get() == 1):
+                    figure1.subplots_adjust(wspace=float(
+                        self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+                else:
+                    self.varXSpace.set(0.1)
+                    self.varYSpace.set(0.1)
+                    figure1.subplots_adjust(wspace=float(
+                        self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+
+                # Show in UI
+                scatter = FigureCanvasTkAgg(figure1, self.plotFrame)
+                scatter.draw()
+                scatter.get_tk_widget().pack()
+
+            # Export
+            if self.isExporting():
+                figure1.savefig(self.plot_getPlotExportPath(".pdf"))
+
+    def plot_plotComparison(self, title, xtitle, xaxis, ytitle, yaxis):
+        ''' Plots all lists. '''
+        # Remove all old plots
+        self.plot_removePlots()
+
+        # Check if data is available
+        if self.samplingFrame.data is None or len(self.samplingFrame.data) == 0:
+            # Case: No data available inform user
+            Label(self.plotFrame, text="No data loaded to plot!").pack()
+        else:
+            jet = plt.get_cmap('Dark2')
+            if self.isGrayscale():
+                jet = plt.get_cmap('gray')
+
+            cNorm = colors.Normalize(vmin=0, vmax=6)
+            scalarMap = cmx.ScalarMappable(norm=cNorm, cmap=jet)
+            scalarMap.get_clim()
+
+            SMALL_SIZE = 8
+            MEDIUM_SIZE = 10
+            BIGGER_SIZE = 12
+
+            # controls default text sizes
+            plt.rc('font', size=BIGGER_SIZE)
+            # fontsize of the axes title
+            plt.rc('axes', titlesize=BIGGER_SIZE)
+            # fontsize of the x and y labels
+            plt.rc('axes', labelsize=BIGGER_SIZE)
+            # fontsize of the tick labels
+            plt.rc('xtick', labelsize=BIGGER_SIZE)
+            # fontsize of the tick labels
+            plt.rc('ytick', labelsize=BIGGER_SIZE)
+            plt.rc('legend', fontsize=BIGGER_SIZE)    # legend fontsize
+            # fontsize of the figure title
+            plt.rc('figure', titlesize=BIGGER_SIZE)
+
+            # Create scatter
+            figure1 = None
+            if(self.overrideWidthHeight.get() == 1):
+                figure1 = plt.Figure(
+                    figsize=(int(self.varWidth.get()), int(self.varHeight.get())), dpi=int(self.varDPI.get()))
+            else:
+                self.varWidth.set(5)
+                self.varHeight.set(4)
+                self.varDPI.set(150)
+                figure1 = plt.Figure(figsize=(5, 4), dpi=150)
+
+            plot = self.plot_createComparePlot(title, figure1, 111, self.samplingFrame.getData(
+            ), 'Algorithm', xaxis, yaxis, scalarMap)
+            plot.set_xlabel(xtitle)
+            if self.isLogarithmicMode():
+                plot.set_ylabel(ytitle + ' in logarithmic scale')
+            else:
+                plot.set_ylabel(ytitle)
+
+            # figure1.autofmt_xdate(rotation=70)
+            if(self.overrideLeftRight.get() == 1):
+                figure1.subplots_adjust(left=float(
+                    self.varLeft.get()), right=float(self.varRight.get()))
+            else:
+                self.varLeft.set(0.15)
+                self.varRight.set(0.99)
+                figure1.subplots_adjust(left=float(
+                    self.varLeft.get()), right=float(self.varRight.get()))
+
+            if(self.overrideTopBottom.get() == 1):
+                figure1.subplots_adjust(top=float(
+                    self.varTop.get()), bottom=float(self.varBottom.get()))
+            else:
+                self.varTop.set(0.99)
+                self.varBottom.set(0.13)
+                figure1.subplots_adjust(top=float(
+                    self.varTop.get()), bottom=float(self.varBottom.get()))
+
+            if(self.overrideSpace.get() == 1):
+                figure1.subplots_adjust(wspace=float(
+                    self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+            else:
+                self.varXSpace.set(0.1)
+                self.varYSpace.set(0.1)
+                figure1.subplots_adjust(wspace=float(
+                    self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+
+            # Export
+            if self.isExporting():
+                figure1.savefig(self.plot_getPlotExportPath(".pdf"))
+
+            # Show in UI
+            scatter = FigureCanvasTkAgg(figure1, self.plotFrame)
+            scatter.draw()
+            scatter.get_tk_widget().pack()
+
+    def plot_plotRangeInternal(self, priorityList, variable):
+        # Remove all old plots
+        self.plot_removePlots()
+
+        # Check if data is available
+        if self.samplingFrame.getData() is None or len(self.samplingFrame.getData()) == 0:
+            # Case: No data available inform user
+            Label(self.plotFrame, text="No data loaded to plot!").pack()
+            return
+
+        # Compute
+        boxPlot = False
+        if len(priorityList) == 0:
+            self.samplingFrame.computeScores(
+                os.path.join(self.args.output, "scores"), [self.samplePrioitization])
+            boxPlot = True
+        elif len(priorityList) == 1:
+            self.samplingFrame.computeScores(
+                os.path.join(self.args.output, "scores"), priorityList)
+            boxPlot = True
+        else:
+            self.samplingFrame.computeScores(
+                os.path.join(self.args.output, "scores"), priorityList)
+
+        jet = plt.get_cmap('Dark2')
+        if self.isGrayscale():
+            jet = plt.get_cmap('gray')
+
+        cNorm = colors.Normalize(vmin=0, vmax=6)
+        scalarMap = cmx.ScalarMappable(norm=cNorm, cmap=jet)
+        scalarMap.get_clim()
+
+        figure1 = None
+        if boxPlot:
+            # Create Boxplots
+            if(self.overrideWidthHeight.get() == 1):
+                figure1 = plt.Figure(
+                    figsize=(int(self.varWidth.get()), int(self.varHeight.get())), dpi=int(self.varDPI.get()))
+            else:
+                self.varWidth.set(20)
+                self.varHeight.set(5)
+                self.varDPI.set(100)
+                figure1 = plt.Figure(figsize=(20, 5), dpi=100)
+
+            self.plot_createBarPlot("NBS (highest-best)", figure1, 141, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'NBS', scalarMap)
+            self.plot_createBarPlot("SRBS (lowest-best)", figure1, 142, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'SRBS', scalarMap)
+            self.plot_createBarPlot("WRBS (lowest-best)", figure1, 143, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'WRBS', scalarMap)
+            self.plot_createBarPlot("IWRBS (highest-best)", figure1, 144, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'IWRBS', scalarMap)
+
+            bar = FigureCanvasTkAgg(figure1, self.plotFrame)
+            bar.draw()
+            bar.get_tk_widget().pack()
+        else:
+            # Determine the axis title
+            title = "Prioritization " + \
+                priorityList[0].printExlusively(variable)
+            ticks = []
+            if variable == "size":
+                title = title + " with variable S"
+                for prio in priorityList:
+                    ticks.append(prio.size)
+            elif variable == "time":
+                title = title + " with variable T"
+                for prio in priorityList:
+                    ticks.append(prio.time)
+            elif variable == "coverage":
+                title = title + " with variable S"
+                for prio in priorityList:
+                    ticks.append(prio.coverage)
+            elif variable == "similarity":
+                title = title + " with variable C"
+                for prio in priorityList:
+                    ticks.append(prio.similarity)
+            elif variable == "memory":
+                title = title + " with variable Sim"
+                for prio in priorityList:
+                    ticks.append(prio.memory)
+
+            # Create scatter
+            if(self.overrideWidthHeight.get() == 1):
+                figure1 = plt.Figure(
+                    figsize=(int(self.varWidth.get()), int(self.varHeight.get())), dpi=int(self.varDPI.get()))
+            else:
+                self.varWidth.set(20)
+                self.varHeight.set(4)
+                self.varDPI.set(100)
+                figure1 = plt.Figure(figsize=(20, 4), dpi=100)
+
+            subplot = self.plot_createPlot("NBS (highest-best)", figure1, 141, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'NBS', scalarMap)
+            subplot.set_xlabel(title)
+            subplot.xaxis.set(ticks=range(0, len(priorityList)),
+                              ticklabels=ticks)
+            subplot = self.plot_createPlot("SRBS (lowest-best)", figure1, 142, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'SRBS', scalarMap)
+            subplot.set_xlabel(title)
+            subplot.xaxis.set(ticks=range(0, len(priorityList)),
+                              ticklabels=ticks)
+            subplot = self.plot_createPlot("WRBS (lowest-best)", figure1, 143, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'WRBS', scalarMap)
+            subplot.set_xlabel(title)
+            subplot.xaxis.set(ticks=range(0, len(priorityList)),
+                              ticklabels=ticks)
+            subplot = self.plot_createPlot("IWRBS (highest-best)", figure1, 144, self.samplingFrame.getAverageData(
+            ), 'Algorithm', 'Prioritization', 'IWRBS', scalarMap)
+            subplot.set_xlabel(title)
+            subplot.xaxis.set(ticks=range(0, len(priorityList)),
+                              ticklabels=ticks)
+
+            if(self.overrideLeftRight.get() == 1):
+                figure1.subplots_adjust(left=float(
+                    self.varLeft.get()), right=float(self.varRight.get()))
+            else:
+                self.varLeft.set(0.15)
+                self.varRight.set(0.99)
+                figure1.subplots_adjust(left=float(
+                    self.varLeft.get()), right=float(self.varRight.get()))
+
+            if(self.overrideTopBottom.get() == 1):
+                figure1.subplots_adjust(top=float(
+                    self.varTop.get()), bottom=float(self.varBottom.get()))
+            else:
+                self.varTop.set(0.9)
+                self.varBottom.set(0.25)
+                figure1.subplots_adjust(top=float(
+                    self.varTop.get()), bottom=float(self.varBottom.get()))
+
+            if(self.overrideSpace.get() == 1):
+                figure1.subplots_adjust(wspace=float(
+                    self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+            else:
+                self.varXSpace.set(0.1)
+                self.varYSpace.set(0.1)
+                figure1.subplots_adjust(wspace=float(
+                    self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+
+            # Show in UI
+            scatter1 = FigureCanvasTkAgg(figure1, self.plotFrame)
+            scatter1.draw()
+            scatter1.get_tk_widget().pack()
+
+        # Export
+        if self.isExporting():
+            figure1.savefig(self.plot_getPlotExportPath(".pdf"))
+
+    def plot_plotRangeSize(self):
+        ''' Plots all lists. '''
+        # Create prioritization list
+        try:
+            prios = []
+            startIndex = int(self.sizeVar.get())
+            endIndex = int(self.sizeVarEnd.get()) + 1
+            stepIncrement = int(self.sizeSteps.get())
+
+            if startIndex >= endIndex:
+                return
+
+            for x in range(startIndex, endIndex, stepIncrement):
+                prio = self.samplePrioitization.copy()
+                prio.size = x
+                prios.append(prio)
+
+            self.plot_plotRangeInternal(prios, "size")
+        except TclError:
+            pass
+
+    def plot_plotRangeTime(self):
+        ''' Plots all lists. '''
+        # Create prioritization list
+        try:
+            prios = []
+            startIndex = int(self.timeVar.get())
+            endIndex = int(self.timeVarEnd.get()) + 1
+            stepIncrement = int(self.sizeSteps.get())
+
+            if startIndex >= endIndex:
+                return
+
+            for x in range(startIndex, endIndex, stepIncrement):
+                prio = self.samplePrioitization.copy()
+                prio.time = x
+                prios.append(prio)
+
+            self.plot_plotRangeInternal(prios, "time")
+        except TclError:
+            pass
+
+    def plot_plotRangeCoverage(self):
+        ''' Plots all lists. '''
+        # Create prioritization list
+        try:
+            prios = []
+            startIndex = int(self.coverageVar.get())
+            endIndex = int(self.coverageVarEnd.get()) + 1
+            stepIncrement = int(self.sizeSteps.get())
+
+            if startIndex >= endIndex:
+                return
+
+            for x in range(startIndex, endIndex, stepIncrement):
+                prio = self.samplePrioitization.copy()
+                prio.coverage = x
+                prios.append(prio)
+
+            self.plot_plotRangeInternal(prios, "coverage")
+        except TclError:
+            pass
+
+    def plot_plotRangeSimilarity(self):
+        ''' Plots all lists. '''
+        # Create prioritization list
+        try:
+            prios = []
+            startIndex = int(self.similarityVar.get())
+            endIndex = int(self.similarityVarEnd.get()) + 1
+            stepIncrement = int(self.sizeSteps.get())
+
+            if startIndex >= endIndex:
+                return
+
+            for x in range(startIndex, endIndex, stepIncrement):
+                prio = self.samplePrioitization.copy()
+                prio.similarity = x
+                prios.append(prio)
+
+            self.plot_plotRangeInternal(prios, "similarity")
+        except TclError:
+            pass
+
+    def plot_plotRangeMemory(self):
+        ''' Plots all lists. '''
+        # Create prioritization list
+        try:
+            prios = []
+            startIndex = int(self.memoryVar.get())
+            endIndex = int(self.memoryVarEnd.get()) + 1
+            stepIncrement = int(self.sizeSteps.get())
+
+            if startIndex >= endIndex:
+                return
+
+            for x in range(startIndex, endIndex, stepIncrement):
+                prio = self.samplePrioitization.copy()
+                prio.memory = x
+                prios.append(prio)
+
+            self.plot_plotRangeInternal(prios, "memory")
+        except TclError:
+            pass
+
+    def plot_createPlot(self, title, figure, subplotID, dataFrame, filterUnqiue, xaxis, yaxis, scalarMap):
+        ''' Creates a plot that shows the given data '''
+        # Create subplot
+        plot = figure.add_subplot(subplotID)
+
+        # Extract list of uniques
+        uniques = dataFrame[filterUnqiue].unique()
+
+        if self.isLogarithmicMode():
+            plot.set_yscale('log')
+            plot.set_ylabel('logarithmic scale')
+        if self.isGridMode():
+            plot.grid()
+
+        colorIndex = 0
+        for unique in uniques:
+            # Create filtered data
+            filteredData = dataFrame[(dataFrame[filterUnqiue] == unique)]
+            t = mpl.markers.MarkerStyle(marker='x')
+            t._transform = t.get_transform().rotate_deg((90/len(uniques)) * colorIndex)
+            plot.scatter(filteredData[xaxis],
+                         filteredData[yaxis], marker=t, s=45, color=scalarMap.to_rgba(colorIndex))
+            colorIndex = colorIndex + 1
+
+        plot.tick_params(axis='y',
+                         direction='inout',
+                         length=10)
+        if not self.isHideLegend():
+            plot.legend(uniques)
+        plot.set_xlabel(xaxis)
+        plot.set_title(title)
+        return plot
+
+    def plot_createComparePlot(self, title, figure, subplotID, dataFrame, filterUnqiue, xaxis, yaxis, scalarMap):
+        ''' Creates a plot that shows the given data '''
+        # Create subplot
+        plot = figure.add_subplot(subplotID)
+
+        # Extract list of uniques
+        uniques = dataFrame[filterUnqiue].unique()
+        filteredDataFrame = dataFrame[dataFrame[yaxis] != -1]
+        if(yaxis == "Sample Size"):
+            filteredDataFrame = filteredDataFrame[filteredDataFrame[yaxis] != 0]
+
+        if self.isLogarithmicMode():
+            plot.set_yscale('log')
+            plot.set_ylabel('logarithmic scale')
+        if self.isGridMode():
+            plot.grid()
+            plot.set_axisbelow(True)
+
+        colorIndex = 0
+        for unique in uniques:
+            # Create filtered data
+            filteredData = filteredDataFrame[(
+                filteredDataFrame[filterUnqiue] == unique)]
+            t = mpl.markers.MarkerStyle(marker='x')
+            t._transform = t.get_transform().rotate_deg((90/len(uniques)) * colorIndex)
+            plot.scatter(filteredData[xaxis],
+                         filteredData[yaxis], marker=t, s=45, color=scalarMap.to_rgba(colorIndex))
+            colorIndex = colorIndex + 1
+
+        plot.tick_params(axis='y',
+                         direction='inout',
+                         length=10)
+        if not self.isHideLegend():
+            plot.legend(uniques)
+        plot.set_xlabel(xaxis)
+        plot.set_title(title)
+
+        if self.isAverageModus():
+            colorIndex = 0
+            for unique in uniques:
+                # Create filtered data
+                filteredData = filteredDataFrame[(
+                    filteredDataFrame[filterUnqiue] == unique)]
+                mean = filteredData[yaxis].mean()
+                plot.axhline(mean, color=scalarMap.to_rgba(
+                    colorIndex), ls=':', label=None)
+                trans = transforms.blended_transform_factory(
+                    plot.get_yticklabels()[0].get_transform(), plot.transData)
+                plot.text(0, mean, "{:.0f}".format(mean), color=scalarMap.to_rgba(
+                    colorIndex), transform=trans, ha="right", va="center")
+                colorIndex = colorIndex + 1
+        return plot
+
+    def plot_createBarPlot(self, title, figure, subplotID, dataFrame, filterUnqiue, xaxis, yaxis, scalarMap):
+        ''' Creates a plot that shows the given data '''
+        # Create subplot
+        plot = figure.add_subplot(subplotID)
+
+        # Extract list of uniques
+        uniques = dataFrame[filterUnqiue].unique()
+
+        if self.isLogarithmicMode():
+            plot.set_yscale('log')
+            plot.set_ylabel('logarithmic scale')
+        if self.isGridMode():
+            plot.grid()
+
+        colorIndex = 0
+        for unique in uniques:
+            filteredData = dataFrame[(
+                dataFrame[filterUnqiue] == unique)][yaxis]
+            vaules = filteredData.values.tolist()
+            plot.bar(colorIndex, vaules, label=unique,
+                     color=scalarMap.to_rgba(colorIndex))
+            colorIndex = colorIndex + 1
+
+        plot.xaxis.set(ticks=range(0, len(uniques)),
+                       ticklabels=uniques)
+        plot.tick_params(axis='y',
+                         direction='inout',
+                         length=10)
+        plot.set_title(title + "\n" + str(dataFrame[xaxis].values.tolist()[0]))
+        if not self.isHideLegend():
+            plot.legend(uniques)
+
+        figure.autofmt_xdate(rotation=70)
+
+        if(self.overrideLeftRight.get() == 1):
+            figure.subplots_adjust(left=float(
+                self.varLeft.get()), right=float(self.varRight.get()))
+        else:
+            self.varLeft.set(0.07)
+            self.varRight.set(0.99)
+            figure.subplots_adjust(left=float(
+                self.varLeft.get()), right=float(self.varRight.get()))
+
+        if(self.overrideTopBottom.get() == 1):
+            figure.subplots_adjust(top=float(
+                self.varTop.get()), bottom=float(self.varBottom.get()))
+        else:
+            self.varTop.set(0.9)
+            self.varBottom.set(0.22)
+            figure.subplots_adjust(top=float(
+                self.varTop.get()), bottom=float(self.varBottom.get()))
+
+        if(self.overrideSpace.get() == 1):
+            figure.subplots_adjust(wspace=float(
+                self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+        else:
+            self.varXSpace.set(0.22)
+            self.varYSpace.set(0.1)
+            figure.subplots_adjust(wspace=float(
+                self.varXSpace.get()), hspace=float(self.varYSpace.get()))
+
+        return plot
+
+    def plot_removePlots(self):
+        ''' Removes all plots. '''
+        self.plotFrame.destroy()
+        self.setupContent_RightToolFrame()
+
+    def plot_getPlotExportPath(self, extension):
+        ''' Opens a file dialog to choose an export path. '''
+        format_str = "%Y_%b_%d_%H_%M_%S"
+        result = datetime.now().strftime(format_str)
+        plotName = self.labelPlotName.get("1.0", END).rstrip()
+        plotName = plotName + '_' + result
+        # plotName = str.replace("\n", "")TODO
+        file_path = os.path.join(self.args.output, "plots")
+        Path(file_path).mkdir(parents=True, exist_ok=True)
+        file_path = os.path.join(file_path, plotName + extension)
+        return file_path
+
+    def isExporting(self):
+        return self.labelPlotName.get(
+            "1.0", END) is not "\n" and self.labelPlotName.get("1.0", END) is not ""
+
+    def isGrayscale(self):
+        return self.grayscaleMode.get() == 1
+
+    def isLogarithmicMode(self):
+        return self.logarithmicMode.get() == 1
+
+    def isGridMode(self):
+        return self.gridMode.get() == 1
+
+    def isAverageModus(self):
+        return self.avaragesMode.get() == 1
+
+    def isHideLegend(self):
+        return self.hideLegend.get() == 1
+
+    def data_importDataFromInputPath(self):
+        ''' Import all data from the input path. '''
+        # Generate and load data
+        self.samplingFrame.load(
+            self.args.input, self.args.jobs, self.args.cache)
+        # Save generated data to disk
+        self.samplingFrame.save(os.path.join(self.args.output, "data"))
+        # Update data info
+        self.update_DataInfo()
+
+    def update_DataInfo(self):
+        ''' Updates the information about the sampling data in the UI. '''
+        if self.samplingFrame == None or len(self.samplingFrame.data) == 0:
+            # Case: No data loaded
+            style = Style()
+            style.configure("BW.TLabel", foreground="red")
+            self.labelDataStatusValue.config(
+                text="No valid Data found!", style="BW.TLabel")
+            self.labelDataEntriesValue.config(text="")
+            self.labelDataAlgorithmsValue.config(text="")
+        else:
+            # Case: data loaded
+            style = Style()
+            style.configure("BW.TLabel", foreground="green")
+            self.labelDataStatusValue.config(
+                text="Data loaded!", style="BW.TLabel")
+            self.labelDataEntriesValue.config(
+                text=str(len(self.samplingFrame.data)))
+            self.labelDataAlgorithmsValue.config(
+                text=self.samplingFrame.data['Algorithm'].unique())
+
+    def update_SizePriority(self):
+        ''' Updates the information about the sampling size priority in the UI. '''
+        try:
+            # Update variable
+            try:
+                self.samplePrioitization.size = self.sizeVar.get()
+            except TclError:
+                return
+
+            print("Updated the size priority to: " +
+                  str(self.samplePrioitization.size))
+        except TclError:
+            print("Oops!  That was no valid number.  Try again...")
+
+    def update_TimePriority(self):
+        ''' Updates the information about the sampling time priority in the UI. '''
+        try:
+            # Update variable
+            try:
+                self.samplePrioitization.time = self.timeVar.get()
+            except TclError:
+                return
+            print("Updated the time priority to: " +
+                  str(self.samplePrioitization.time))
+        except TclError:
+            print("Oops!  That was no valid number.  Try again...")
+
+    def update_CoveragePriority(self):
+        ''' Updates the information about the sampling coverage priority in the UI. '''
+        try:
+            # Update variable
+            try:
+                self.samplePrioitization.coverage = self.coverageVar.get()
+            except TclError:
+                return
+            print("Updated the coverage priority to: " +
+                  str(self.samplePrioitization.coverage))
+        except TclError:
+            print("Oops!  That was no valid number.  Try again...")
+
+    def update_SimilarityPriority(self):
+        ''' Updates the information about the sampling similarity priority in the UI. '''
+        try:
+            # Update variable
+            try:
+                self.samplePrioitization.similarity = self.similarityVar.get()
+            except TclError:
+                return
+            print("Updated the similarity priority to: " +
+                  str(self.samplePrioitization.similarity))
+        except TclError:
+            print("Oops!  That was no valid number.  Try again...")
+
+    def update_MemoryPriority(self):
+        ''' Updates the information about the sampling memory priority in the UI. '''
+        try:
+            # Update variable
+            try:
+                self.samplePrioitization.memory = self.memoryVar.get()
+            except TclError:
+                return
+            print("Updated the memory priority to: " +
+                  str(self.samplePrioitization.memory))
+        except TclError:
+            print("Oops!  That was no valid number.  Try again...")
+
+    def openInputFolder(self):
+        ''' Opens the explorer showing the folder containing the input data. '''
+        subprocess.Popen('explorer ' + self.args.input)
+
+    def openExportFolder(self):
+        ''' Opens the explorer showing the folder containing the exported plots. '''
+        subprocess.Popen(
+            'explorer ' + os.path.join(self.args.output, "plots"))
+
+    def openOutputFolder(self):
+        ''' Opens the explorer showing the folder containing the evaluation results. '''
+        subprocess.Popen('explorer ' + self.args.output)
+
+    def setupContent_ButtonMenu(self, master):
+        ''' Create a menu item with the following entires: (input, reload, export, quit). '''
+        self.menubar = Menu(self.frame)
+        self.menubar.add_command(label="Exit", command=self.frame.quit)
+
+    def setupContent_LeftToolFrame(self):
+        ''' Creates a tool frame containing tools about changing the prios or plotting the data. '''
+        toolFrame = Frame(self.frame)
+        toolFrame.grid(row=0, column=0, sticky="n")
+
+        frameStyle = Style()
+        frameStyle.configure("BW.TLabelFrame", foreground="red")
+        frameRow = 0
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for priorities
+        # ----------------------------------------------------------------------------------------------------------------
+        prioritiesFrame = LabelFrame(toolFrame, text="Prioritizations")
+        prioritiesFrame.grid(row=frameRow, column=0,
+                             sticky="wens", pady=10, padx=10)
+
+        row = 0
+
+        # Add steps field
+        self.sizeSteps = DoubleVar()
+        self.sizeSteps.set(1)
+        Label(prioritiesFrame, text="Steps for range:").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.sizeSteps, from_=-1000, to_=1000).\
+            grid(row=row, column=1, columnspan=4, sticky="e")
+        row += 1
+
+        # Add Size
+        self.sizeVar = DoubleVar()
+        self.sizeVar.set(self.samplePrioitization.size)
+        self.sizeVarEnd = DoubleVar()
+        self.sizeVarEnd.set(0)
+        self.sizeVar.trace_add("write", lambda var, indx,
+                               mode: self.update_SizePriority())
+        Label(prioritiesFrame, text="Size").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.sizeVar, from_=-1000, to_=1000).\
+            grid(row=row, column=1)
+        Label(prioritiesFrame, text=" - ").\
+            grid(row=row, column=2)
+        Spinbox(prioritiesFrame, textvariable=self.sizeVarEnd, from_=-1000, to_=1000).\
+            grid(row=row, column=3)
+        Button(prioritiesFrame, text="Plot Range", command=lambda: self.plot_plotRangeSize()).\
+            grid(row=row, column=4, sticky="e")
+        row += 1
+
+        # Add Time
+        self.timeVar = DoubleVar()
+        self.timeVar.set(self.samplePrioitization.time)
+        self.timeVarEnd = DoubleVar()
+        self.timeVarEnd.set(0)
+        self.timeVar.trace_add("write", lambda var, indx,
+                               mode: self.update_TimePriority())
+        Label(prioritiesFrame, text="Time").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.timeVar, from_=-1000, to_=1000).\
+            grid(row=row, column=1)
+        Label(prioritiesFrame, text=" - ").\
+            grid(row=row, column=2)
+        Spinbox(prioritiesFrame, textvariable=self.timeVarEnd, from_=-1000, to_=1000).\
+            grid(row=row, column=3)
+        Button(prioritiesFrame, text="Plot Range", command=lambda: self.plot_plotRangeTime()).\
+            grid(row=row, column=4, sticky="e")
+        row += 1
+
+        # Add Coverage
+        self.coverageVar = DoubleVar()
+        self.coverageVar.set(self.samplePrioitization.coverage)
+        self.coverageVarEnd = DoubleVar()
+        self.coverageVarEnd.set(0)
+        self.coverageVar.trace_add("write", lambda var, indx,
+                                   mode: self.update_CoveragePriority())
+        Label(prioritiesFrame, text="Coverage").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.coverageVar, from_=-1000, to_=1000).\
+            grid(row=row, column=1)
+        Label(prioritiesFrame, text=" - ").\
+            grid(row=row, column=2)
+        Spinbox(prioritiesFrame, textvariable=self.coverageVarEnd, from_=-1000, to_=1000).\
+            grid(row=row, column=3)
+        Button(prioritiesFrame, text="Plot Range", command=lambda: self.plot_plotRangeCoverage()).\
+            grid(row=row, column=4, sticky="e")
+        row += 1
+
+        # Add Similarity
+        self.similarityVar = DoubleVar()
+        self.similarityVar.set(self.samplePrioitization.similarity)
+        self.similarityVarEnd = DoubleVar()
+        self.similarityVarEnd.set(0)
+        self.similarityVar.trace_add("write", lambda var, indx,
+                                     mode: self.update_SimilarityPriority())
+        Label(prioritiesFrame, text="Similarity").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.similarityVar, from_=-1000, to_=1000).\
+            grid(row=row, column=1)
+        Label(prioritiesFrame, text=" - ").\
+            grid(row=row, column=2)
+        Spinbox(prioritiesFrame, textvariable=self.similarityVarEnd, from_=-1000, to_=1000).\
+            grid(row=row, column=3)
+        Button(prioritiesFrame, text="Plot Range", command=lambda: self.plot_plotRangeSimilarity()).\
+            grid(row=row, column=4, sticky="e")
+        row += 1
+
+        # Add Memory
+        self.memoryVar = DoubleVar()
+        self.memoryVar.set(self.samplePrioitization.memory)
+        self.memoryVarEnd = DoubleVar()
+        self.memoryVarEnd.set(0)
+        self.memoryVar.trace_add("write", lambda var, indx,
+                                 mode: self.update_MemoryPriority())
+        Label(prioritiesFrame, text="Memory").\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(prioritiesFrame, textvariable=self.memoryVar, from_=-1000, to_=1000).\
+            grid(row=row, column=1)
+        Label(prioritiesFrame, text=" - ").\
+            grid(row=row, column=2)
+        Spinbox(prioritiesFrame, textvariable=self.memoryVarEnd, from_=-1000, to_=1000).\
+            grid(row=row, column=3)
+        Button(prioritiesFrame, text="Plot Range", command=lambda: self.plot_plotRangeMemory()).\
+            grid(row=row, column=4, sticky="e")
+        row += 1
+
+        buttonAddToList = Button(
+            prioritiesFrame, text="Add to list", command=self.plot_addToList)
+        buttonAddToList.grid(row=row, columnspan=5, sticky="wens")
+        row += 1
+
+        labelEvalList = Label(prioritiesFrame, text="Plot List")
+        labelEvalList.grid(row=row, columnspan=5, sticky="wens")
+        row += 1
+        self.listEvalList = Listbox(prioritiesFrame, width=20, height=4)
+        self.listEvalList.grid(row=row, columnspan=5, sticky="wens")
+        row += 1
+
+        buttonClearList = Button(
+            prioritiesFrame, text="Clear list", command=self.plot_clearList)
+        buttonClearList.grid(row=row, columnspan=5, sticky="we")
+        row += 1
+
+        buttonPlotPrio = Button(
+            prioritiesFrame, text="Plot list", command=lambda: self.plot_plotList())
+        buttonPlotPrio.grid(row=row, columnspan=5, sticky="wens")
+        row += 1
+
+        buttonClearPlots = Button(
+            prioritiesFrame, text="Delete plot", command=self.plot_removePlots)
+        buttonClearPlots.grid(row=row, columnspan=5, sticky="wens")
+        row += 1
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for comparison self, title, xtitle, xaxis, ytitle, yaxis
+        # ----------------------------------------------------------------------------------------------------------------
+        frameRow += 1
+        comparisonFrame = LabelFrame(toolFrame, text="Comparison")
+        comparisonFrame.grid(row=frameRow, column=0,
+                             sticky="wens", pady=10, padx=10)
+
+        Button(comparisonFrame, text="Size", command=lambda: self.plot_plotComparison(
+            'Sample Size',
+            'number of features',
+            'System Features',
+            'size',
+            'Sample Size')).\
+            grid(row=row, column=0)
+        Button(comparisonFrame, text="Time", command=lambda: self.plot_plotComparison(
+            'Sample Time',
+            'number of features',
+            'System Features',
+            'time',
+            'Sample Time')).\
+            grid(row=row, column=1)
+        Button(comparisonFrame, text="Coverage", command=lambda: self.plot_plotComparison(
+            'Sample Coverage',
+            'number of features',
+            'System Features',
+            'coverage',
+            'Sample Coverage')).\
+            grid(row=row, column=2)
+        Button(comparisonFrame, text="Similarity", command=lambda: self.plot_plotComparison(
+            'Sample Similarity',
+            'number of features',
+            'System Features',
+            'similarity',
+            'Sample Similarity')).\
+            grid(row=row, column=3)
+        Button(comparisonFrame, text="Memory", command=lambda: self.plot_plotComparison(
+            'Sample Memory',
+            'number of features',
+            'System Features',
+            'consumed memory',
+            'Sample Memory')).\
+            grid(row=row, column=4)
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for plot options
+        # ----------------------------------------------------------------------------------------------------------------
+        frameRow += 1
+        plotOptionFrame = LabelFrame(toolFrame, text="Plot Options")
+        plotOptionFrame.grid(row=frameRow, column=0,
+                             sticky="wens", pady=10, padx=10)
+
+        row = 0
+        labelPlotNameLabel = Label(plotOptionFrame, text=("Plot Name:"))
+        labelPlotNameLabel.grid(row=row, column=0, sticky="w")
+        self.labelPlotName = Text(plotOptionFrame, height=1, width=20)
+        self.labelPlotName.grid(row=row, column=1, columnspan=4, sticky="we")
+        row += 1
+
+        self.grayscaleMode = IntVar()
+        grayscaleModeButton = Checkbutton(
+            plotOptionFrame, text="Grayscale Mode", variable=self.grayscaleMode)
+        grayscaleModeButton.grid(row=row, columnspan=4, sticky="wens")
+        row += 1
+
+        self.logarithmicMode = IntVar()
+        logarithmicModeButton = Checkbutton(
+            plotOptionFrame, text="Logarithmic Scale", variable=self.logarithmicMode)
+        logarithmicModeButton.grid(row=row, columnspan=4, sticky="wens")
+        row += 1
+
+        self.gridMode = IntVar()
+        gridModeButton = Checkbutton(
+            plotOptionFrame, text="Draw Grid", variable=self.gridMode)
+        gridModeButton.grid(row=row, columnspan=4, sticky="wens")
+        row += 1
+
+        self.avaragesMode = IntVar()
+        avaragesModeButton = Checkbutton(
+            plotOptionFrame, text="Draw Averages", variable=self.avaragesMode)
+        avaragesModeButton.grid(row=row, columnspan=4, sticky="wens")
+        row += 1
+
+        self.hideLegend = IntVar()
+        hideLegendButton = Checkbutton(
+            plotOptionFrame, text="Hide Legend", variable=self.hideLegend)
+        hideLegendButton.grid(row=row, columnspan=4, sticky="wens")
+        row += 1
+
+        # Figure Size
+        self.overrideWidthHeight = IntVar()
+        self.overrideWidthHeight.set(0)
+        self.varWidth = DoubleVar()
+        self.varWidth.set(0)
+        self.varHeight = DoubleVar()
+        self.varHeight.set(0)
+        self.varDPI = DoubleVar()
+        self.varDPI.set(0)
+        Checkbutton(
+            plotOptionFrame, text="Override Width/Height & DPI", variable=self.overrideWidthHeight).\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(plotOptionFrame, textvariable=self.varWidth, width=10).\
+            grid(row=row, column=1)
+        Spinbox(plotOptionFrame, textvariable=self.varHeight, width=10).\
+            grid(row=row, column=2)
+        Spinbox(plotOptionFrame, textvariable=self.varDPI, width=10).\
+            grid(row=row, column=3)
+        row += 1
+
+        # Figure Top/bottom
+        self.overrideTopBottom = IntVar()
+        self.overrideTopBottom.set(0)
+        self.varTop = DoubleVar()
+        self.varTop.set(0)
+        self.varBottom = DoubleVar()
+        self.varBottom.set(0)
+        Checkbutton(
+            plotOptionFrame, text="Override Top/Bottom", variable=self.overrideTopBottom).\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(plotOptionFrame, textvariable=self.varTop, width=10).\
+            grid(row=row, column=1)
+        Spinbox(plotOptionFrame, textvariable=self.varBottom, width=10).\
+            grid(row=row, column=2)
+        row += 1
+
+        # Figure Top/bottom
+        self.overrideLeftRight = IntVar()
+        self.overrideLeftRight.set(0)
+        self.varLeft = DoubleVar()
+        self.varLeft.set(0)
+        self.varRight = DoubleVar()
+        self.varRight.set(0)
+        Checkbutton(
+            plotOptionFrame, text="Override Left/Right", variable=self.overrideLeftRight).\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(plotOptionFrame, textvariable=self.varLeft, width=10).\
+            grid(row=row, column=1)
+        Spinbox(plotOptionFrame, textvariable=self.varRight, width=10).\
+            grid(row=row, column=2)
+        row += 1
+
+        # Figure Top/bottom
+        self.overrideSpace = IntVar()
+        self.overrideSpace.set(0)
+        self.varXSpace = DoubleVar()
+        self.varXSpace.set(0)
+        self.varYSpace = DoubleVar()
+        self.varYSpace.set(0)
+        Checkbutton(
+            plotOptionFrame, text="Override X/Y Space", variable=self.overrideSpace).\
+            grid(row=row, column=0, sticky="w")
+        Spinbox(plotOptionFrame, textvariable=self.varXSpace, width=10).\
+            grid(row=row, column=1)
+        Spinbox(plotOptionFrame, textvariable=self.varYSpace, width=10).\
+            grid(row=row, column=2)
+        row += 1
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for data info (Pack Layout)
+        # ----------------------------------------------------------------------------------------------------------------
+        frameRow += 1
+        dataFrame = LabelFrame(toolFrame, text="Data Information")
+        dataFrame.grid(row=frameRow, column=0, sticky="wens", pady=10, padx=10)
+        labelDataStatus = Label(dataFrame, text="Status:")
+        labelDataStatus.grid(row=0, column=0, sticky="w")
+        style = Style()
+        style.configure("BW.TLabel", foreground="red")
+        self.labelDataStatusValue = Label(
+            dataFrame, text="No data loaded", style="BW.TLabel")
+        self.labelDataStatusValue.grid(row=0, column=1)
+
+        labelDataEntries = Label(dataFrame, text="Number of Entries:")
+        labelDataEntries.grid(row=1, column=0, sticky="w")
+        self.labelDataEntriesValue = Label(dataFrame, text="")
+        self.labelDataEntriesValue.grid(row=1, column=1)
+
+        labelDataAlgorithms = Label(dataFrame, text="Algorithms:")
+        labelDataAlgorithms.grid(row=2, column=0, sticky="w")
+        self.labelDataAlgorithmsValue = Label(dataFrame, text="")
+        self.labelDataAlgorithmsValue.grid(row=2, column=1)
+
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for data import(Pack Layout)
+        # ----------------------------------------------------------------------------------------------------------------
+        frameRow += 1
+        importFrame = LabelFrame(toolFrame, text="Import")
+        importFrame.grid(row=frameRow, column=0,
+                         sticky="wens", pady=10, padx=10)
+
+        # Handle import of data
+        buttonCreateDataFromInputFolder = Button(
+            importFrame, text="Load Data", command=self.data_importDataFromInputPath)
+        buttonCreateDataFromInputFolder.pack(fill=X)
+
+        # ----------------------------------------------------------------------------------------------------------------
+        # Create frame for data loading (Pack Layout)
+        # ----------------------------------------------------------------------------------------------------------------
+        frameRow += 1
+        pathFrames = LabelFrame(toolFrame, text="Paths")
+        pathFrames.grid(row=frameRow, column=0,
+                        sticky="wens", pady=10, padx=10)
+
+        # Handle loading of data
+        buttonOpenInputFolder = Button(
+            pathFrames, text="Open Input Folder", command=self.openInputFolder)
+        buttonOpenInputFolder.pack(fill=X)
+
+        buttonShowOutputMap = Button(
+            pathFrames, text="Open Output Folder", command=self.openOutputFolder)
+        buttonShowOutputMap.pack(fill=X)
+
+        buttonPlotPrio = Button(
+            pathFrames, text="Open Saved Plots Folder", command=lambda: self.openExportFolder())
+        buttonPlotPrio.pack(fill=X)
+
+    def setupContent_RightToolFrame(self):
+        ''' Creates a plot frame '''
+        self.plotFrame = Frame(self.frame)
+        self.plotFrame.grid(row=0, column=1, sticky="wens")
+
+    def __init__(self, master, args):
+        self.master = master
+        self.frame = Frame(master)
+        self.frame.grid()
+
+        # Setup menu
+        self.setupContent_ButtonMenu(master)
+        master.config(menu=self.menubar)
+
+        # Parse arguments and extract prioritizations
+        self.args = args
+        self.samplePrioitization = getPrioritization(self.args)
+
+        # Setup empty sampling frame
+        self.samplingFrame = SamplingFrame(args.aggregate, args.penalty, getMetrics(args))
+
+        # Setup toolframe
+        self.setupContent_RightToolFrame()
+        self.setupContent_LeftToolFrame()
+
+        # Load all data
+        # self.data_importDataFromInputPath()
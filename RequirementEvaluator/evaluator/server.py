@@ -0,0 +1,172 @@
+# Evaluation server of the requirements evaluator, only imported by the server modes.
+import asyncio
+import io
+import json
+import math
+import os
+import stat
+import pandas as pd
+
+from .core import AverageAccumulator, getPrioritizationFromWeights
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# EvaluationServer
+#
+#
+#
+#
+#
+#
+#
+#
+#
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EvaluationServer:
+    ''' Answers evaluation requests of a minimal HTTP/JSON API from the loaded sampling frame, which stays in memory
+    between the requests. Endpoints:
+        GET /health: number of loaded rows and algorithms
+        GET /scores: scores of the default prioritization
+        POST /evaluate: scores of {"weights": {"size": 1, ...}, "csv": "..."}, missing weights keep the default
+            prioritization and the optional csv text (a result file) is evaluated together with the loaded rows '''
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               500: "Internal Server Error"}
+
+    def __init__(self, samplingFrame, prioritization):
+        self.samplingFrame = samplingFrame
+        self.prioritization = prioritization
+        # Warm the averages and keep the running sums of the loaded rows for the mean
+        samplingFrame.getAlgorithmAverages()
+        self.accumulator = samplingFrame.accumulator
+        if self.accumulator is None and samplingFrame.aggregate == "mean":
+            self.accumulator = AverageAccumulator(
+                samplingFrame.averageMapping, samplingFrame.getSamplingValues)
+            self.accumulator.add(samplingFrame.getData())
+
+    async def serve(self, port=None, socketPath=None):
+        ''' Serves on the given local port or unix socket until cancelled. '''
+        if socketPath:
+            # Only replace a stale socket, never another file
+            if os.path.exists(socketPath):
+                if not stat.S_ISSOCK(os.stat(socketPath).st_mode):
+                    print(socketPath + " exists and is not a socket")
+                    exit()
+                os.remove(socketPath)
+            server = await asyncio.start_unix_server(self.handleConnection, path=socketPath)
+            print("Serving on " + socketPath)
+        else:
+            server = await asyncio.start_server(self.handleConnection, "127.0.0.1", port)
+            print("Serving on http://127.0.0.1:" + str(port))
+        async with server:
+            await server.serve_forever()
+
+    async def handleConnection(self, reader, writer):
+        ''' Answers a single HTTP request, the scoring runs in a worker thread so other connections are not blocked. '''
+        try:
+            method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1")
+                if line.strip() == "":
+                    break
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            status, response = await asyncio.get_running_loop().run_in_executor(
+                None, self.respond, method, target.split("?")[0], body)
+        except (ValueError, asyncio.IncompleteReadError):
+            status, response = 400, {"error": "Malformed request"}
+        except Exception as error:
+            # Answer unexpected errors instead of dropping the connection
+            status, response = 500, {"error": type(error).__name__ + ": " + str(error)}
+
+        payload = json.dumps(response).encode("utf-8")
+        writer.write(("HTTP/1.1 " + str(status) + " " + self.reasons[status] + "\r\n" +
+                      "Content-Type: application/json\r\n" +
+                      "Content-Length: " + str(len(payload)) + "\r\n" +
+                      "Connection: close\r\n\r\n").encode("latin-1") + payload)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def respond(self, method, path, body):
+        ''' Returns the status and the JSON response of the given request. '''
+        routes = {"/health": "GET", "/scores": "GET", "/evaluate": "POST"}
+        if path not in routes:
+            return 404, {"error": "Unknown path " + path}
+        if method != routes[path]:
+            return 405, {"error": path + " expects " + routes[path]}
+        if path == "/health":
+            return 200, {"rows": len(self.samplingFrame.getData()),
+                         "algorithms": len(self.samplingFrame.getAlgorithmAverages())}
+        if path == "/scores":
+            return 200, self.evaluate({})
+        try:
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Expected a JSON object")
+            return 200, self.evaluate(request)
+        except (ValueError, TypeError) as error:
+            return 400, {"error": str(error)}
+
+    def evaluate(self, request):
+        ''' Scores the prioritization of the given request against the loaded rows and the rows of its csv. '''
+        samplingFrame = self.samplingFrame
+        # Weights of the request over the default prioritization
+        weights = dict(zip([metric.key for metric in samplingFrame.metrics],
+                           self.prioritization.getWeights(samplingFrame.metrics)))
+        requestWeights = request.get("weights", {})
+        if not isinstance(requestWeights, dict):
+            raise ValueError("Expected the weights as an object of metric keys and weights")
+        for key, weight in requestWeights.items():
+            if key not in weights:
+                raise ValueError("Unknown metric " + str(key) + ", expected one of: " + ", ".join(weights))
+            weight = float(weight)
+            if not math.isfinite(weight):
+                raise ValueError("Expected a finite weight for " + key)
+            weights[key] = int(weight) if weight.is_integer() else weight
+        prioritization = getPrioritizationFromWeights(
+            list(weights.values()), samplingFrame.metrics)
+
+        averages = samplingFrame.getAlgorithmAverages()
+        if request.get("csv"):
+            if not isinstance(request["csv"], str):
+                raise ValueError("Expected the csv as text")
+            entries = samplingFrame.convertFileData(
+                pd.read_csv(io.StringIO(request["csv"]), sep=";"), "the request csv")
+            if entries is None:
+                raise ValueError("The csv does not match the expected schema")
+            averages = self.getAveragesWith(entries)
+
+        average = samplingFrame.scoreTable([prioritization], averages)
+        columns = ["Algorithm", "NBS", "NBS Rank", "SRBS", "SRBS Rank", "WRBS", "WRBS Rank",
+                   "IWRBS", "IWRBS Rank"] + samplingFrame.criteriaAveraged
+        return {"prioritization": str(prioritization),
+                "aggregation": samplingFrame.aggregate,
+                "penalty": samplingFrame.penalty,
+                "results": json.loads(average[columns].to_json(orient="records", double_precision=15))}
+
+    def getAveragesWith(self, entries):
+        ''' Returns the averages of the loaded rows together with the given entries without changing the frame. The
+        mean adds the entries to a copy of the running sums, the other aggregators aggregate all rows again. '''
+        if self.accumulator is None:
+            return self.samplingFrame.computeAverages(self.samplingFrame.concatEntries(
+                [self.samplingFrame.getData(), entries]))
+        accumulator = AverageAccumulator(
+            self.accumulator.averageMapping, self.accumulator.getValues)
+        accumulator.sums, accumulator.counts = self.accumulator.sums, self.accumulator.counts
+        accumulator.add(entries)
+        return accumulator.getAverages()